@@ -7,14 +7,24 @@
 This script scans a user-provided directory for all 'all_jobs_raw.csv' files,
 filters rows based on city keywords found in ANY column, 
 and merges them into a deduplicated CSV file in the script's directory.
-Refactored (v. 00002) - Fixed missing headers and added master column synchronization.
+Refactored (v. 00019) - Robustness: Only I/O errors skip a file; CSV and
+decoding errors stop the read but keep the rows parsed so far.
 """
 
 import csv
+import hashlib
+import mmap
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Dict, Iterable, Iterator, List, Set
+
+# Resolved once per process: the output directory and run timestamp never change
+_SCRIPT_LOCATION = Path(__file__).resolve().parent
+_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M")
 
 
 class CityJobFilter:
@@ -29,11 +39,10 @@ class CityJobFilter:
         self.search_path = Path(search_dir)
         
         # Determine the absolute directory where THIS script is located
-        self.script_location = Path(__file__).resolve().parent
+        self.script_location = _SCRIPT_LOCATION
         
         # Output filename: YYYYMMDD_HHMM__filtered_jobs_city.csv
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-        self.output_file = self.script_location / f"{timestamp}__filtered_jobs_city.csv"
+        self.output_file = self.script_location / f"{_TIMESTAMP}__filtered_jobs_city.csv"
         
         # Master headers to ensure consistency with engine.py v3.3.7
         self.master_headers: List[str] = [
@@ -63,6 +72,19 @@ class CityJobFilter:
             "munchen"
         ]
 
+        # Lowercased once; duplicates are dropped while keeping the configured order
+        self._cities_lc = tuple(dict.fromkeys(city.lower() for city in self.cities))
+
+        # One case-insensitive alternation replaces the per-city substring scans
+        self.city_pattern = re.compile("|".join(re.escape(city) for city in self._cities_lc), re.IGNORECASE)
+
+        # Byte-level twin for the file pre-filter; bytes patterns fold ASCII case only
+        self._city_bytes_pattern = (
+            re.compile(b"|".join(re.escape(city.encode("utf-8")) for city in self._cities_lc), re.IGNORECASE)
+            if all(city.isascii() for city in self._cities_lc)
+            else None
+        )
+
     def run(self) -> int:
         """Main execution loop for finding and filtering job records by city.
 
@@ -77,79 +99,165 @@ class CityJobFilter:
             return 0
 
         # Find all raw CSV files recursively
-        raw_files = list(self.search_path.glob("**/all_jobs_raw.csv"))
+        raw_files = sorted(self._iter_raw_csvs(self.search_path))
         print(f"📂 Found {len(raw_files)} 'all_jobs_raw.csv' files.")
 
-        unique_jobs: List[Dict[str, Any]] = []
-        seen_links: Set[str] = set()
+        # Files are handed to workers in batches to amortize inter-process round trips
+        chunksize = max(1, len(raw_files) // ((os.cpu_count() or 1) * 4))
 
-        for csv_path in raw_files:
-            matches = self._process_file(csv_path, seen_links)
-            if matches:
-                unique_jobs.extend(matches)
+        # Files are scanned in parallel; results are deduplicated and written as they arrive
+        with ProcessPoolExecutor() as executor:
+            total = self._write_results(executor.map(self._process_file, raw_files, chunksize=chunksize))
 
-        if unique_jobs:
-            self._write_results(unique_jobs, self.master_headers)
-            print(f"✅ Filter complete. Found {len(unique_jobs)} unique jobs in target cities.")
+        if total:
+            print(f"✅ Filter complete. Found {total} unique jobs in target cities.")
             print(f"💾 File created: {self.output_file.name}")
         else:
             print("⚠️  No jobs matching the city criteria were found.")
 
-        return len(unique_jobs)
+        return total
+
+    @staticmethod
+    def _iter_raw_csvs(root: Path) -> Iterator[Path]:
+        """Walks the tree with os.scandir and yields every 'all_jobs_raw.csv'.
 
-    def _process_file(self, path: Path, seen_links: Set[str]) -> List[Dict[str, Any]]:
-        """Reads a CSV and returns matching rows, skipping existing URLs.
+        Args:
+            root: Directory to search recursively.
+
+        Yields:
+            Path: Location of each raw CSV file found.
+        """
+        stack = [str(root)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "all_jobs_raw.csv" and entry.is_file():
+                        yield Path(entry.path)
+
+    @staticmethod
+    def _link_fingerprint(link: str) -> int:
+        """Returns a compact 64-bit fingerprint of a job URL for deduplication.
+
+        Args:
+            link: The job posting URL.
+
+        Returns:
+            int: Integer fingerprint; collisions are negligible at dataset scale.
+        """
+        return int.from_bytes(hashlib.blake2b(link.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def _process_file(self, path: Path) -> Dict[int, List[str]]:
+        """Reads a CSV and returns matching rows that carry a URL.
+
+        Runs inside a worker process: duplicates within the file are dropped here,
+        duplicates across files are left to the caller.
 
         Args:
             path: Path to a specific all_jobs_raw.csv.
-            seen_links: Set for URL deduplication.
 
         Returns:
-            List[Dict[str, Any]]: List of matching records.
+            Dict[int, List[str]]: Matching records ordered like master_headers,
+            keyed by their link fingerprint.
         """
-        matches = []
+        matches: Dict[int, List[str]] = {}
         try:
-            with path.open("r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    link = row.get("link", "")
-                    if not link or link in seen_links:
-                        continue
-                    
-                    if self._is_city_match(row):
-                        matches.append(row)
-                        seen_links.add(link)
-        except Exception as e:
+            if not self._file_mentions_city(path):
+                return matches
+
+            # 1 MiB buffer cuts read syscalls; newline="" is what the csv module expects
+            f = path.open("r", encoding="utf-8", newline="", buffering=1 << 20)
+        except OSError as e:
             print(f"   ⚠️ Skipping {path.name} due to error: {e}")
-        
+            return matches
+
+        with f:
+            # Plain reader: rows stay lists and are projected onto master_headers by index
+            reader = csv.reader(f)
+            try:
+                header = next(reader, [])
+                if "link" not in header:
+                    return matches
+                link_idx = header.index("link")
+                out_idxs = [header.index(h) if h in header else -1 for h in self.master_headers]
+
+                for row in reader:
+                    link = row[link_idx] if link_idx < len(row) else ""
+                    if link and self._is_city_match(row):
+                        fingerprint = self._link_fingerprint(link)
+                        if fingerprint not in matches:
+                            matches[fingerprint] = [row[i] if 0 <= i < len(row) else "" for i in out_idxs]
+            except (csv.Error, UnicodeDecodeError) as e:
+                # Keep the rows parsed before the malformed record
+                print(f"   ⚠️ Stopped reading {path.name} at line {reader.line_num}: {e}")
+
         return matches
 
-    def _is_city_match(self, row: Dict[str, Any]) -> bool:
+    def _file_mentions_city(self, path: Path) -> bool:
+        """Scans the raw file bytes for any city keyword before parsing rows.
+
+        Args:
+            path: Path to a specific all_jobs_raw.csv.
+
+        Returns:
+            bool: False only if no city keyword occurs anywhere in the file.
+        """
+        if self._city_bytes_pattern is None:
+            return True
+
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._city_bytes_pattern.search(mm) is not None
+
+    def _is_city_match(self, row: List[str]) -> bool:
         """Checks if ANY column in the row contains any of the target city keywords.
 
         Args:
-            row: Dictionary containing row data.
+            row: List of raw column values.
 
         Returns:
             bool: True if a city keyword is found anywhere in the row.
         """
-        # Join all values into one string and search
-        row_content = " ".join(str(val) for val in row.values()).lower()
-        
-        return any(city.lower() in row_content for city in self.cities)
+        # Test column by column and stop at the first hit instead of joining the whole row
+        search = self.city_pattern.search
+        return any(search(val) for val in row)
 
-    def _write_results(self, jobs: List[Dict[str, Any]], headers: List[str]) -> None:
-        """Writes the filtered dataset to the script's directory.
+    def _write_results(self, batches: Iterable[Dict[int, List[str]]]) -> int:
+        """Streams deduplicated records into the output CSV in the script's directory.
 
         Args:
-            jobs: List of job records.
-            headers: Field names for the CSV.
+            batches: Fingerprint-keyed matching records of each scanned file, in file order.
+
+        Returns:
+            int: Number of unique records written.
         """
+        seen_links: Set[int] = set()
+        written = 0
         with self.output_file.open("w", newline="", encoding="utf-8") as f:
-            # extrasaction="ignore" ensures that if a row is missing a column, it won't crash
-            writer = csv.DictWriter(f, fieldnames=headers, extrasaction="ignore")
-            writer.writeheader()
-            writer.writerows(jobs)
+            # Rows already follow master_headers, which guarantees 'work_location_type'
+            writer = csv.writer(f)
+            writer.writerow(self.master_headers)
+            for matches in batches:
+                # Links are already fingerprinted by the workers; only set lookups remain here
+                fresh = [row for fingerprint, row in matches.items() if fingerprint not in seen_links]
+                seen_links.update(matches)
+
+                # One batched write per scanned file
+                writer.writerows(fresh)
+                written += len(fresh)
+
+        if not written:
+            # Do not leave a header-only file behind
+            self.output_file.unlink()
+
+        return written
 
 
 if __name__ == "__main__":
@@ -161,4 +269,4 @@ if __name__ == "__main__":
     consolidator = CityJobFilter(target_dir)
     consolidator.run()
 
-# End of helper/filter_jobs_for_city.py (v. 00002)
\ No newline at end of file
+# End of helper/filter_jobs_for_city.py (v. 00019)
\ No newline at end of file
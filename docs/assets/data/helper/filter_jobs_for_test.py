@@ -7,14 +7,23 @@
 This script scans a user-provided directory for all 'all_jobs_raw.csv' files,
 filters rows based on keywords found EXCLUSIVELY in the 'title' column, 
 and merges them into a deduplicated CSV file in the script's directory.
-Refactored (v. 00005) - Fixed missing headers and added master column synchronization.
+Refactored (v. 00019) - Robustness: Only I/O errors skip a file; CSV and
+decoding errors stop the read but keep the rows parsed so far.
 """
 
 import csv
+import hashlib
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Dict, Iterable, Iterator, List, Set
+
+# Resolved once per process: the output directory and run timestamp never change
+_SCRIPT_LOCATION = Path(__file__).resolve().parent
+_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M")
 
 
 class JobConsolidator:
@@ -29,11 +38,10 @@ class JobConsolidator:
         self.search_path = Path(search_dir)
         
         # Determine the absolute directory where THIS script is located
-        self.script_location = Path(__file__).resolve().parent
+        self.script_location = _SCRIPT_LOCATION
         
         # Output filename: YYYYMMDD_HHMM__filtered_jobs.csv
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-        self.output_file = self.script_location / f"{timestamp}__filtered_jobs.csv"
+        self.output_file = self.script_location / f"{_TIMESTAMP}__filtered_jobs.csv"
         
         # Master headers to ensure consistency with engine.py v3.3.7
         self.master_headers: List[str] = [
@@ -68,6 +76,12 @@ class JobConsolidator:
             "testautomatisierung"
         ]
 
+        # Lowercased once; duplicates are dropped while keeping the configured order
+        self._keywords_lc = tuple(dict.fromkeys(k.lower() for k in self.keywords))
+
+        # One case-insensitive alternation scans a title once for all keywords
+        self.keyword_pattern = re.compile("|".join(re.escape(k) for k in self._keywords_lc), re.IGNORECASE)
+
     def run(self) -> int:
         """Main execution loop for finding and filtering job records.
 
@@ -81,79 +95,145 @@ class JobConsolidator:
             return 0
 
         # Find all raw CSV files recursively
-        raw_files = list(self.search_path.glob("**/all_jobs_raw.csv"))
+        raw_files = sorted(self._iter_raw_csvs(self.search_path))
         print(f"📂 Found {len(raw_files)} 'all_jobs_raw.csv' files.")
 
-        unique_jobs: List[Dict[str, Any]] = []
-        seen_links: Set[str] = set()
+        # Files are handed to workers in batches to amortize inter-process round trips
+        chunksize = max(1, len(raw_files) // ((os.cpu_count() or 1) * 4))
 
-        for csv_path in raw_files:
-            matches = self._process_file(csv_path, seen_links)
-            if matches:
-                unique_jobs.extend(matches)
+        # Files are scanned in parallel; results are deduplicated and written as they arrive
+        with ProcessPoolExecutor() as executor:
+            total = self._write_results(executor.map(self._process_file, raw_files, chunksize=chunksize))
 
-        if unique_jobs:
-            self._write_results(unique_jobs, self.master_headers)
-            print(f"✅ Complete. Found {len(unique_jobs)} unique jobs with target keywords in Title.")
+        if total:
+            print(f"✅ Complete. Found {total} unique jobs with target keywords in Title.")
             print(f"💾 File: {self.output_file.name}")
         else:
             print("⚠️  No jobs with matching keywords in 'title' were found.")
 
-        return len(unique_jobs)
+        return total
+
+    @staticmethod
+    def _iter_raw_csvs(root: Path) -> Iterator[Path]:
+        """Walks the tree with os.scandir and yields every 'all_jobs_raw.csv'.
 
-    def _process_file(self, path: Path, seen_links: Set[str]) -> List[Dict[str, Any]]:
-        """Reads a CSV and returns matching rows, skipping existing URLs.
+        Args:
+            root: Directory to search recursively.
+
+        Yields:
+            Path: Location of each raw CSV file found.
+        """
+        stack = [str(root)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "all_jobs_raw.csv" and entry.is_file():
+                        yield Path(entry.path)
+
+    @staticmethod
+    def _link_fingerprint(link: str) -> int:
+        """Returns a compact 64-bit fingerprint of a job URL for deduplication.
+
+        Args:
+            link: The job posting URL.
+
+        Returns:
+            int: Integer fingerprint; collisions are negligible at dataset scale.
+        """
+        return int.from_bytes(hashlib.blake2b(link.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def _process_file(self, path: Path) -> Dict[int, List[str]]:
+        """Reads a CSV and returns matching rows that carry a URL.
+
+        Runs inside a worker process: duplicates within the file are dropped here,
+        duplicates across files are left to the caller.
 
         Args:
             path: Path to a specific all_jobs_raw.csv.
-            seen_links: Set for URL deduplication.
 
         Returns:
-            List[Dict[str, Any]]: List of matching records.
+            Dict[int, List[str]]: Matching records ordered like master_headers,
+            keyed by their link fingerprint.
         """
-        matches = []
+        matches: Dict[int, List[str]] = {}
         try:
-            with path.open("r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    link = row.get("link", "")
-                    if not link or link in seen_links:
-                        continue
-                    
-                    if self._is_title_match(row):
-                        matches.append(row)
-                        seen_links.add(link)
-        except Exception as e:
+            # 1 MiB buffer cuts read syscalls; newline="" is what the csv module expects
+            f = path.open("r", encoding="utf-8", newline="", buffering=1 << 20)
+        except OSError as e:
             print(f"   ⚠️ Skipping {path.name} due to error: {e}")
-        
+            return matches
+
+        with f:
+            # Plain reader: rows stay lists and are projected onto master_headers by index
+            reader = csv.reader(f)
+            try:
+                header = next(reader, [])
+                if "link" not in header or "title" not in header:
+                    return matches
+                link_idx = header.index("link")
+                title_idx = header.index("title")
+                out_idxs = [header.index(h) if h in header else -1 for h in self.master_headers]
+
+                for row in reader:
+                    link = row[link_idx] if link_idx < len(row) else ""
+                    title = row[title_idx] if title_idx < len(row) else ""
+                    if link and self._is_title_match(title):
+                        fingerprint = self._link_fingerprint(link)
+                        if fingerprint not in matches:
+                            matches[fingerprint] = [row[i] if 0 <= i < len(row) else "" for i in out_idxs]
+            except (csv.Error, UnicodeDecodeError) as e:
+                # Keep the rows parsed before the malformed record
+                print(f"   ⚠️ Stopped reading {path.name} at line {reader.line_num}: {e}")
+
         return matches
 
-    def _is_title_match(self, row: Dict[str, Any]) -> bool:
+    def _is_title_match(self, title: str) -> bool:
         """Checks if the 'title' column contains any of the target keywords.
 
         Args:
-            row: Dictionary containing row data.
+            title: Raw value of the 'title' column.
 
         Returns:
             bool: True if a keyword is found in the title.
         """
         # Strict search only in 'title' field
-        job_title = str(row.get("title", "")).lower()
-        
-        return any(k.lower() in job_title for k in self.keywords)
+        return self.keyword_pattern.search(title) is not None
 
-    def _write_results(self, jobs: List[Dict[str, Any]], headers: List[str]) -> None:
-        """Writes the filtered dataset to the script's directory.
+    def _write_results(self, batches: Iterable[Dict[int, List[str]]]) -> int:
+        """Streams deduplicated records into the output CSV in the script's directory.
 
         Args:
-            jobs: List of job records.
-            headers: Field names for the CSV.
+            batches: Fingerprint-keyed matching records of each scanned file, in file order.
+
+        Returns:
+            int: Number of unique records written.
         """
+        seen_links: Set[int] = set()
+        written = 0
         with self.output_file.open("w", newline="", encoding="utf-8") as f:
-            # Using master_headers to guarantee the presence of 'work_location_type'
-            writer = csv.DictWriter(f, fieldnames=headers, extrasaction="ignore")
-            writer.writeheader()
-            writer.writerows(jobs)
+            # Rows already follow master_headers, which guarantees 'work_location_type'
+            writer = csv.writer(f)
+            writer.writerow(self.master_headers)
+            for matches in batches:
+                # Links are already fingerprinted by the workers; only set lookups remain here
+                fresh = [row for fingerprint, row in matches.items() if fingerprint not in seen_links]
+                seen_links.update(matches)
+
+                # One batched write per scanned file
+                writer.writerows(fresh)
+                written += len(fresh)
+
+        if not written:
+            # Do not leave a header-only file behind
+            self.output_file.unlink()
+
+        return written
 
 
 if __name__ == "__main__":
@@ -165,4 +245,4 @@ if __name__ == "__main__":
     consolidator = JobConsolidator(target_dir)
     consolidator.run()
 
-# End of helper/filter_jobs_for_test.py (v. 00005)
\ No newline at end of file
+# End of helper/filter_jobs_for_test.py (v. 00019)
\ No newline at end of file
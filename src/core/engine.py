@@ -6,25 +6,94 @@
 
 This module orchestrates the job search pipeline, supporting both automated
 portal scraping and manual URL analysis with EN/DE language detection.
-Refactored (v. 00052) - Final Scoring Parity: Enforced full re-calculation
-during enrichment to eliminate discrepancies between manual and auto modes.
+Refactored (v. 00087) - Performance: The shared session caps connections per
+host, retries only connect and gateway errors, and ignores Retry-After.
 """
 
 import contextlib
 import csv
+import functools
+import hashlib
+import heapq
 import json
 import re
+import string
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
 from pathlib import Path
+from queue import Empty, SimpleQueue
 from threading import Lock
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+    cast,
+)
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.core.provider_registry import ProviderRegistry
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # Optional speed-up, stdlib json is the fallback
+    HAS_ORJSON = False
+
+# Skills written with symbols are matched as plain substrings (no word boundaries)
+SYMBOL_SKILLS = frozenset({"c++", "c#", ".net"})
+
+# Word tokens used for skill boundaries (mirrors the [^a-zA-Z0-9] boundary class)
+_WORD_RE = re.compile(r"[a-zA-Z0-9]+")
+_ASCII_ALNUM = frozenset(string.ascii_letters + string.digits)
+
+# Column order of every CSV export
+CSV_HEADERS = (
+    "relevance_score",
+    "search_criteria",
+    "provider",
+    "title",
+    "company",
+    "location",
+    "work_location_type",
+    "employment_type",
+    "matching_skills",
+    "missing_skills",
+    "detected_languages",
+    "matched_roles",
+    "salary_hint",
+    "posted_at_relative",
+    "link",
+    "scraped_at",
+)
+
+# Stop-word language detection
+_TOKEN_RE = re.compile(r"\b\w{2,}\b")
+_DE_WORDS = frozenset({"der", "die", "das", "und", "mit", "von", "den", "auf", "ist"})
+_EN_WORDS = frozenset({"the", "and", "with", "from", "for", "that", "this", "is", "are"})
+
+# Per-job description scans
+_SALARY_RE = re.compile(
+    r"(?:Salary|Gehalt|Stundensatz|Vergütung):?\s*([€$]\s?\d{2,3}[kK]|\d{2,3}[.,]\d{3}\s?[€$]|EUR)", re.IGNORECASE
+)
+REMOTE_KEYWORDS = ("remote", "home office", "homeoffice", "ortsunabhängig", "telearbeit", "mobil", "100%")
+# Remote keywords and "hybrid" in one alternation; neither can hide the other inside a match
+_WORK_LOCATION_RE = re.compile("|".join(re.escape(kw) for kw in (*REMOTE_KEYWORDS, "hybrid")))
+
 
 class InvalidJSONContentError(TypeError):
     """Raised when the loaded JSON content is not a dictionary."""
@@ -34,16 +103,70 @@ class InvalidJSONContentError(TypeError):
         super().__init__("JSON content must be a dictionary")
 
 
+# Parsed global skills file: raw JSON, normalized (candidates, label) pairs of all global skills
+# and the candidate spellings of the globals related to each scoring category
+GlobalSkillTable = Tuple[Dict[str, Any], Tuple[Tuple[FrozenSet[str], str], ...], Dict[str, FrozenSet[str]]]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_global_skill_table(path: str, mtime_ns: int) -> GlobalSkillTable:  # noqa: ARG001
+    """Loads and normalizes a global skills file once per file version.
+
+    The modification time is part of the cache key only, so an edited file is
+    parsed again. The returned structures are shared between engine instances
+    and must be treated as read-only.
+
+    Args:
+        path: Resolved path of the global skills JSON.
+        mtime_ns: Modification time of the file in nanoseconds.
+
+    Returns:
+        GlobalSkillTable: Raw data, normalized globals and the global
+        candidates per scoring category.
+    """
+    raw = JobSearchEngine._load_json(Path(path))
+    by_category: Dict[str, tuple] = {k: tuple(v) for k, v in raw.items()}
+    all_globals = tuple(s for lst in by_category.values() for s in lst)
+    normalized = JobSearchEngine._normalize_skills(all_globals, titled=True)
+    candidates_by_key: Dict[str, FrozenSet[str]] = {}
+    for _, key in JobSearchEngine.SCORE_CATEGORIES:
+        related = by_category.get(f"{key}_skills", ()) + by_category.get(key, ())
+        candidates_by_key[key] = frozenset(cand for s in related for cand in JobSearchEngine._skill_candidates(s))
+    return raw, normalized, candidates_by_key
+
+
 class JobSearchEngine:
     """Main class managing the job search and analysis pipeline."""
 
     HTTP_OK: int = 200
-    MAX_WORKERS_SEARCH: int = 6
+    MAX_WORKERS_SEARCH: int = 32
     MAX_WORKERS_ENRICH: int = 5
+    # Upper bound on open connections to any single portal host; further threads wait for a free one
+    MAX_CONNECTIONS_PER_HOST: int = 8
     AUTOSAVE_INTERVAL: int = 5
     MAX_LOG_TITLE_LENGTH: int = 35
     MAX_RETRIES_PER_QUERY: int = 2
 
+    DEFAULT_SCORING_WEIGHTS: ClassVar[Dict[str, int]] = {
+        "programming_languages": 20,
+        "testing_skills": 20,
+        "embedded_firmware": 15,
+        "ai_ml_skills": 20,
+        "known_companies": 10,
+        "seniority_level": 15,
+    }
+
+    # Profile skill categories reported as matching skills
+    MATCH_CATEGORIES = ("programming", "testing", "embedded", "ai_ml", "ai_tools")
+
+    # (scoring weight key, profile skills key) pairs scored per category
+    SCORE_CATEGORIES = (
+        ("programming_languages", "programming"),
+        ("testing_skills", "testing"),
+        ("embedded_firmware", "embedded"),
+        ("ai_ml_skills", "ai_ml"),
+    )
+
     def __init__(
         self,
         search_profile_name: str = "default",
@@ -58,8 +181,13 @@ class JobSearchEngine:
 
         self.profile: Dict[str, Any] = self._load_json(self.cv_path)
         self.config: Dict[str, Any] = self._load_json(self.config_path)
-        self.global_skills_raw: Dict[str, Any] = self._load_json(self.global_skills_path)
+        # Parsed and normalized once per file version, shared between engines built in the same process
+        self._global_skill_table = _load_global_skill_table(
+            str(self.global_skills_path.resolve()), self.global_skills_path.stat().st_mtime_ns
+        )
+        self.global_skills_raw: Dict[str, Any] = self._global_skill_table[0]
 
+        self.active_providers: List[Tuple[str, int, str]] = ProviderRegistry.get_active_providers(self.config)
         if forced_providers:
             self._override_providers(forced_providers)
 
@@ -67,6 +195,11 @@ class JobSearchEngine:
         self._init_session()
         self.jobs_data: List[Dict[str, Any]] = []
         self.data_lock: Lock = Lock()
+        # Provider threads hand their result batches over here; search_jobs drains it into jobs_data
+        # (attribute annotations in a method body are never evaluated, so SimpleQueue[...] is fine on 3.8)
+        self._job_queue: SimpleQueue[List[Dict[str, Any]]] = SimpleQueue()
+        self._enrich_cache: Dict[bytes, Dict[str, Any]] = {}
+        self._enrich_cache_lock: Lock = Lock()
         self.is_manual_mode: bool = False
         self._setup_output_dir()
 
@@ -91,179 +224,204 @@ class JobSearchEngine:
 
         self.is_manual_mode = True
         print(f"\n🚀 MANUAL MODE: Loading links from {csv_path.name}")
-        manual_links = []
-        with csv_path.open("r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                link = row.get("link")
-                if not link:
-                    continue
-
-                p_key = ProviderRegistry.get_provider_key_from_url(link) or "linkedin"
-
-                job_template = {
-                    "link": link,
-                    "provider": p_key,
-                    "job_id": str(time.time()),
-                    "title": "Pending Extraction...",
-                    "company": "Pending Extraction...",
-                    "location": "Remote",
-                    "description": "",
-                    "scraped_at": datetime.now(timezone.utc).isoformat(),
-                    "posted_at_relative": "N/A",
-                    "work_location_type": "Remote",
-                    "employment_type": "Freelance",
-                    "search_criteria": f"Manual | {csv_path.name}",
-                    "relevance_score": 0,
-                }
-                manual_links.append(job_template)
-
-        with self.data_lock:
-            self.jobs_data = manual_links
+        # No other thread runs while the links load, so the list is built from the stream in one go
+        self.jobs_data = list(self._iter_manual_jobs(csv_path))
 
         start_time = time.time()
         self.finalize_pipeline(start_time)
         return len(self.jobs_data)
 
+    @classmethod
+    def _iter_manual_jobs(cls, csv_path: Path) -> Iterator[Dict[str, Any]]:
+        """Streams a pending job template for every link of a manual input CSV."""
+        scraped_at = datetime.now(timezone.utc).isoformat()
+        criteria = f"Manual | {csv_path.name}"
+        for row_num, link in cls._iter_manual_links(csv_path):
+            yield {
+                "link": link,
+                "provider": ProviderRegistry.get_provider_key_from_url(link) or "linkedin",
+                "job_id": f"manual_{row_num}",
+                "title": "Pending Extraction...",
+                "company": "Pending Extraction...",
+                "location": "Remote",
+                "description": "",
+                "scraped_at": scraped_at,
+                "posted_at_relative": "N/A",
+                "work_location_type": "Remote",
+                "employment_type": "Freelance",
+                "search_criteria": criteria,
+                "relevance_score": 0,
+            }
+
+    @staticmethod
+    def _iter_manual_links(csv_path: Path) -> Iterator[Tuple[int, str]]:
+        """Streams (row number, link) pairs from the 'link' column of a manual input CSV."""
+        with csv_path.open("r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if "link" not in header:
+                return
+            link_idx = header.index("link")
+            for row_num, row in enumerate(reader, 1):
+                link = row[link_idx] if link_idx < len(row) else ""
+                if link:
+                    yield row_num, link
+
     def finalize_pipeline(self, start_time: float) -> None:
         """Completes the common steps of the analysis pipeline."""
         self.remove_duplicates()
-        self._enrich_all_jobs_locally()
+        # Fetching re-scores every job it touches, so the local pass would be thrown away
+        if not self._should_fetch_descriptions():
+            self._enrich_all_jobs_locally()
         self.fetch_full_descriptions()
         self.analyze_and_score()
 
-        self.save_raw_data(silent=False)
-        self.autosave_filtered(silent=False)
-        self.generate_report()
+        # One shallow snapshot shared by every writer
+        snapshot = self._snapshot_jobs()
+        self._write_all_outputs(snapshot)
+        self.generate_report(snapshot=snapshot)
         print(f"\n✅ DONE! ({time.time() - start_time:.1f}s)")
 
     def _enrich_all_jobs_locally(self) -> None:
         """Performs initial scoring on all jobs in the data list."""
-        with self.data_lock:
-            for job in self.jobs_data:
-                self._enrich_job_data(job)
-
-    def _detect_language(self, text: str) -> str:
-        """Detects if text is primarily English or German."""
-        text_lower = text.lower()
-        de_words = {"der", "die", "das", "und", "mit", "von", "den", "auf", "ist"}
-        en_words = {"the", "and", "with", "from", "for", "that", "this", "is", "are"}
-
-        words = re.findall(r"\b\w{2,}\b", text_lower)
-        de_score = sum(1 for w in words if w in de_words)
-        en_score = sum(1 for w in words if w in en_words)
+        # Jobs are updated in place after searching finished, so the lock only guards the copy
+        for job in self._snapshot_jobs():
+            self._enrich_job_data(job)
+
+    def _detect_language(self, text_lower: str) -> str:
+        """Detects if already lowercased text is primarily English or German."""
+        de_score = en_score = 0
+        for match in _TOKEN_RE.finditer(text_lower):
+            word = match.group()
+            if word in _DE_WORDS:
+                de_score += 1
+            elif word in _EN_WORDS:
+                en_score += 1
 
         return "de" if de_score > en_score else "en"
 
-    def _has_skill(self, text: str, skill_entry: Union[str, Dict[str, str]]) -> bool:
-        """Matches skill allowing for string or dict {en, de} structure."""
-        text_lower = text.lower()
-
-        if isinstance(skill_entry, dict):
-            candidates = [str(v).lower() for v in skill_entry.values()]
-        else:
-            candidates = [str(skill_entry).lower()]
-
-        for cand in candidates:
-            esc_cand = re.escape(cand)
-            if cand in ["c++", "c#", ".net"]:
-                if cand in text_lower:
-                    return True
-                continue
-            pattern = rf"(?:^|[^a-zA-Z0-9]){esc_cand}(?:$|[^a-zA-Z0-9])"
-            if re.search(pattern, text_lower):
+    @staticmethod
+    def _has_skill(matched: Set[str], candidates: FrozenSet[str]) -> bool:
+        """Checks whether any spelling of a normalized skill was matched in a job."""
+        return not candidates.isdisjoint(matched)
+
+    def _match_skills(self, text_lower: str) -> Set[str]:
+        """Finds every indexed skill candidate in the text with a single pass over its words."""
+        found = {cand for cand in self._symbol_skills if cand in text_lower}
+        found.update(cand for cand in self._bounded_skills if self._find_bounded(text_lower, cand))
+
+        # A bounded match always starts at a word start and ends at a word end,
+        # so only phrases spanning up to _max_phrase_words words need a lookup.
+        spans = [m.span() for m in _WORD_RE.finditer(text_lower)]
+        phrases, width = self._phrase_skills, self._max_phrase_words
+        for i, (start, _) in enumerate(spans):
+            for _, end in spans[i : i + width]:
+                phrase = text_lower[start:end]
+                if phrase in phrases:
+                    found.add(phrase)
+        return found
+
+    @staticmethod
+    def _find_bounded(text_lower: str, cand: str) -> bool:
+        """Finds `cand` in the text with a non-alphanumeric (or no) character on both sides."""
+        idx = text_lower.find(cand)
+        while idx != -1:
+            end = idx + len(cand)
+            if (idx == 0 or text_lower[idx - 1] not in _ASCII_ALNUM) and (
+                end == len(text_lower) or text_lower[end] not in _ASCII_ALNUM
+            ):
                 return True
+            idx = text_lower.find(cand, idx + 1)
         return False
 
     def _enrich_job_data(self, job: Dict[str, Any]) -> None:
         """Analyzes text and populates skill/score fields with bilingual support."""
-        desc = job.get("description", "")
-
         # Isolated scoring text - EXCLUDE search_criteria for consistency
-        scoring_components = [job.get("title", ""), job.get("company", ""), desc, job.get("location", "")]
-        text_to_score = " ".join([str(c) for c in scoring_components]).lower()
+        scoring_components = [
+            str(job.get("title", "")),
+            str(job.get("company", "")),
+            str(job.get("description", "")),
+            str(job.get("location", "")),
+        ]
+
+        # Identical postings (and unchanged re-enrichment) reuse the earlier analysis
+        cache_key = hashlib.blake2b(
+            "\x1f".join(scoring_components).encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        with self._enrich_cache_lock:
+            fields = self._enrich_cache.get(cache_key)
+        if fields is None:
+            fields = self._analyze_job_text(scoring_components)
+            with self._enrich_cache_lock:
+                self._enrich_cache[cache_key] = fields
+
+        for key, value in fields.items():
+            # Keep a salary the provider already extracted; only override location type on a keyword hit
+            if (key == "salary_hint" and job.get("salary_hint")) or (key == "work_location_type" and not value):
+                continue
+            job[key] = value
+
+    def _analyze_job_text(self, scoring_components: List[str]) -> Dict[str, Any]:
+        """Computes the enrichment fields for a (title, company, description, location) tuple."""
+        _, company, desc, _ = scoring_components
+        text_to_score = " ".join(scoring_components).lower()
+        fields: Dict[str, Any] = {}
 
         lang = self._detect_language(text_to_score)
-        job["detected_languages"] = "German" if lang == "de" else "English"
+        fields["detected_languages"] = "German" if lang == "de" else "English"
 
-        found_mine = []
-        for cat in ["programming", "testing", "embedded", "ai_ml", "ai_tools"]:
-            skills = self.profile.get("skills", {}).get(cat, [])
-            for s in skills:
-                if self._has_skill(text_to_score, s):
-                    label = s["en"] if isinstance(s, dict) else s
-                    found_mine.append(label.title())
+        # One scan of the text answers every skill question below
+        matched = self._match_skills(text_to_score)
+
+        found_mine = set()
+        for cat in self.MATCH_CATEGORIES:
+            for cands, label in self._normalized_skills[cat]:
+                if self._has_skill(matched, cands):
+                    found_mine.add(label)
 
-        job["matching_skills"] = ", ".join(sorted(set(found_mine))[:15])
+        fields["matching_skills"] = ", ".join(heapq.nsmallest(15, found_mine))
 
-        role_entries = self.profile.get("skills", {}).get("roles", [])
-        matched_roles_list = []
-        for r in role_entries:
-            if self._has_skill(text_to_score, r):
-                label = r["en"] if isinstance(r, dict) else r
-                matched_roles_list.append(label)
-        job["matched_roles"] = ", ".join(sorted(set(matched_roles_list)))
+        matched_roles = set()
+        for cands, label in self._normalized_skills["roles"]:
+            if self._has_skill(matched, cands):
+                matched_roles.add(label)
+        fields["matched_roles"] = ", ".join(sorted(matched_roles))
 
         found_global = set()
-        for cat_list in self.global_skills_raw.values():
-            for s in cat_list:
-                if self._has_skill(text_to_score, s):
-                    label = s["en"] if isinstance(s, dict) else s
-                    found_global.add(label.title())
-
-        missing = [s for s in found_global if s not in found_mine]
-        job["missing_skills"] = ", ".join(missing[:10])
-
-        if not job.get("salary_hint"):
-            sal_pattern = (
-                r"(?:Salary|Gehalt|Stundensatz|Vergütung):?\s*([€$]\s?\d{2,3}[kK]|\d{2,3}[.,]\d{3}\s?[€$]|EUR)"
-            )
-            sal = re.search(sal_pattern, desc, re.IGNORECASE)
-            job["salary_hint"] = sal.group(1) if sal else ""
+        for cands, label in self._normalized_globals:
+            if self._has_skill(matched, cands):
+                found_global.add(label)
+
+        fields["missing_skills"] = ", ".join(heapq.nsmallest(10, found_global - found_mine))
+
+        sal = _SALARY_RE.search(desc)
+        fields["salary_hint"] = sal.group(1) if sal else ""
 
         # Default fallback for location type if not already extracted by provider
-        rem_kws = ["remote", "home office", "homeoffice", "ortsunabhängig", "telearbeit", "mobil", "100%"]
-        if any(kw in text_to_score for kw in rem_kws):
-            job["work_location_type"] = "Remote"
-        elif "hybrid" in text_to_score:
-            job["work_location_type"] = "Hybrid"
+        location_type = ""
+        for loc_match in _WORK_LOCATION_RE.finditer(text_to_score):
+            if loc_match.group() != "hybrid":
+                location_type = "Remote"
+                break
+            location_type = "Hybrid"
+        fields["work_location_type"] = location_type
 
         # ALWAYS calculate from scratch to avoid stale data from "Pending" state
-        self._calculate_relevance_score(job, text_to_score)
+        fields["relevance_score"] = self._calculate_relevance_score(company, matched, len(matched_roles))
+        return fields
 
-    def _calculate_relevance_score(self, job: Dict[str, Any], text: str) -> None:
+    def _calculate_relevance_score(self, company: str, matched: Set[str], role_matches: int) -> int:
         """Calculates relevance score using dynamic category scaling."""
-        score, max_score = 0, 0
-        weights = self.config.get("scoring_weights", {})
-        if not weights:
-            weights = {
-                "programming_languages": 20,
-                "testing_skills": 20,
-                "embedded_firmware": 15,
-                "ai_ml_skills": 20,
-                "known_companies": 10,
-                "seniority_level": 15,
-            }
-
-        categories = [
-            ("programming_languages", "programming"),
-            ("testing_skills", "testing"),
-            ("embedded_firmware", "embedded"),
-            ("ai_ml_skills", "ai_ml"),
-        ]
-
-        skills_profile = self.profile.get("skills", {})
+        score: int = 0
+        max_score: float = 0
 
-        for weight_key, profile_key in categories:
-            weight = weights.get(weight_key, 20)
-            skills = skills_profile.get(profile_key, [])
+        for profile_key, weight in self._category_weights:
+            profile_cands, global_cands = self._category_candidates[profile_key]
 
-            matches = sum(1 for s in skills if self._has_skill(text, s))
+            matches = sum(1 for cands in profile_cands if not cands.isdisjoint(matched))
 
             # Check if category is relevant to the job at all
-            is_category_mentioned = any(
-                self._has_skill(text, s) for s in self.global_skills_raw.get(f"{profile_key}_skills", [])
-            ) or any(self._has_skill(text, s) for s in self.global_skills_raw.get(profile_key, []))
+            is_category_mentioned = not global_cands.isdisjoint(matched)
 
             if is_category_mentioned:
                 max_score += weight
@@ -271,20 +429,20 @@ class JobSearchEngine:
             else:
                 max_score += weight * 0.25
 
-        cw = weights.get("known_companies", 10)
-        sw = weights.get("seniority_level", 15)
+        cw, sw = self._company_weight, self._seniority_weight
 
         max_score += cw + sw
 
         # Known companies bonus
-        if any(c.lower() in str(job.get("company", "")).lower() for c in self.profile.get("known_companies", [])):
+        company_lower = company.lower()
+        # Exact names hit the set; partial names ("Siemens" in "Siemens AG") fall back to substring checks
+        if company_lower in self._known_companies_set or any(c in company_lower for c in self._known_companies_lower):
             score += cw
 
         # Seniority / Roles bonus
-        role_matches = len(job.get("matched_roles", "").split(",")) if job.get("matched_roles") else 0
         score += min(sw, role_matches * 5)
 
-        job["relevance_score"] = int((score / max_score) * 100) if max_score > 0 else 0
+        return int((score / max_score) * 100) if max_score > 0 else 0
 
     def _print_config_summary(self) -> None:
         """Prints configuration overview."""
@@ -310,10 +468,14 @@ class JobSearchEngine:
                 return p
         return Path("configs/core/user_default.json")
 
-    def _load_json(self, path: Path) -> Dict[str, Any]:
+    @staticmethod
+    def _load_json(path: Path) -> Dict[str, Any]:
         """Loads JSON data."""
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        if HAS_ORJSON:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
         if not isinstance(data, dict):
             raise InvalidJSONContentError()
         return cast(Dict[str, Any], data)
@@ -322,15 +484,103 @@ class JobSearchEngine:
         """Initializes skills for matching."""
         self.CORE_SKILLS = self.profile.get("skills", {})
         self.MY_SKILLS_SET = set()
-        for cat in ["programming", "testing", "embedded", "ai_ml", "ai_tools"]:
+        for cat in self.MATCH_CATEGORIES:
             skills = self.CORE_SKILLS.get(cat, [])
             for s in skills:
                 val = s["en"].lower() if isinstance(s, dict) else s.lower()
                 self.MY_SKILLS_SET.add(val)
 
+        # Scoring weights resolved once; the profile and config do not change during a run
+        weights = self.config.get("scoring_weights", {}) or self.DEFAULT_SCORING_WEIGHTS
+        self._category_weights = tuple((key, weights.get(w_key, 20)) for w_key, key in self.SCORE_CATEGORIES)
+        self._company_weight = weights.get("known_companies", 10)
+        self._seniority_weight = weights.get("seniority_level", 15)
+        self._known_companies_lower = tuple(c.lower() for c in self.profile.get("known_companies", []))
+        self._known_companies_set = frozenset(self._known_companies_lower)
+
+        # Global skills come pre-flattened and normalized from the shared table
+        _, self._normalized_globals, global_candidates = self._global_skill_table
+
+        # (candidate spellings, label) pairs so the per-job loops skip isinstance checks and lowering;
+        # skill labels are stored in their Title Case display form, role labels as written
+        self._normalized_skills = {
+            cat: self._normalize_skills(self.CORE_SKILLS.get(cat, []), titled=True) for cat in self.MATCH_CATEGORIES
+        }
+        self._normalized_skills["roles"] = self._normalize_skills(self.CORE_SKILLS.get("roles", []))
+
+        # Per scoring category: candidate set of each profile skill, and all candidates of the related globals
+        self._category_candidates: Dict[str, Tuple[Tuple[FrozenSet[str], ...], FrozenSet[str]]] = {}
+        for _, key in self.SCORE_CATEGORIES:
+            self._category_candidates[key] = (
+                tuple(cands for cands, _ in self._normalized_skills[key]),
+                global_candidates[key],
+            )
+
+        self._init_skill_index()
+
+    @staticmethod
+    def _skill_candidates(skill_entry: Union[str, Dict[str, str]]) -> FrozenSet[str]:
+        """Returns the lowercased spellings of a skill (string or dict {en, de})."""
+        if isinstance(skill_entry, dict):
+            return frozenset(str(v).lower() for v in skill_entry.values())
+        return frozenset([str(skill_entry).lower()])
+
+    @classmethod
+    def _normalize_skills(
+        cls, entries: Iterable[Union[str, Dict[str, str]]], titled: bool = False
+    ) -> Tuple[Tuple[FrozenSet[str], str], ...]:
+        """Converts raw skill entries into (candidate spellings, English label) pairs."""
+        normalized = []
+        for s in entries:
+            label = s["en"] if isinstance(s, dict) else s
+            normalized.append((cls._skill_candidates(s), label.title() if titled else label))
+        return tuple(normalized)
+
+    def _init_skill_index(self) -> None:
+        """Indexes every profile and global skill candidate for single-pass matching."""
+        all_candidates: Set[str] = set()
+        for normalized in (*self._normalized_skills.values(), self._normalized_globals):
+            for cands, _ in normalized:
+                all_candidates.update(cands)
+
+        self._phrase_skills: Set[str] = set()
+        self._symbol_skills: Set[str] = set()
+        self._bounded_skills: Set[str] = set()
+        self._max_phrase_words = 1
+
+        for cand in all_candidates:
+            if cand in SYMBOL_SKILLS:
+                self._symbol_skills.add(cand)
+            elif _WORD_RE.fullmatch(cand[:1]) and _WORD_RE.fullmatch(cand[-1:]):
+                self._phrase_skills.add(cand)
+                self._max_phrase_words = max(self._max_phrase_words, len(_WORD_RE.findall(cand)))
+            else:
+                # Rare candidates starting/ending with a symbol get an explicit boundary check
+                self._bounded_skills.add(cand)
+
     def _init_session(self) -> None:
         """Inits HTTP session."""
         self.session = requests.Session()
+
+        # Keep-alive pools (one per host, capped at MAX_CONNECTIONS_PER_HOST) plus a short retry on gateway
+        # errors. Read timeouts are not retried and Retry-After is ignored, so a slow host cannot stall a thread.
+        retry = Retry(
+            total=2,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.MAX_WORKERS_SEARCH,
+            pool_maxsize=self.MAX_CONNECTIONS_PER_HOST,
+            pool_block=True,
+            max_retries=retry,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         ua = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         self.session.headers.update({"User-Agent": ua, "Accept-Language": "en-US,en;q=0.9"})
 
@@ -338,7 +588,7 @@ class JobSearchEngine:
         """Prepares output folder."""
         ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M")
         base = self.config_path.stem.replace("user_", "").replace("_search", "")
-        active_keys = [p[0] for p in ProviderRegistry.get_active_providers(self.config)]
+        active_keys = [p[0] for p in self.active_providers]
         name = f"{ts}_{base}_{'_'.join(sorted(active_keys))}"
         self.output_dir = Path("outputs") / name
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -356,13 +606,33 @@ class JobSearchEngine:
             else:
                 self.config["active_providers"][lower]["enabled"] = True
 
+        # Provider activation only changes here, so the resolved list is refreshed here too
+        self.active_providers = ProviderRegistry.get_active_providers(self.config)
+
     def search_jobs(self) -> None:
         """Executes Phase 1: Searching."""
         print("\n" + "=" * 75 + "\n🔍 PHASE 1: SEARCHING\n" + "=" * 75)
-        active_providers = ProviderRegistry.get_active_providers(self.config)
-        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS_SEARCH) as executor:
-            for key, limit, color in active_providers:
-                executor.submit(self._run_provider_search, key, limit, color)
+        active_providers = self.active_providers
+        if not active_providers:
+            return
+
+        # One worker per provider: portals run side by side while each keeps its own sequential pacing
+        workers = min(self.MAX_WORKERS_SEARCH, len(active_providers))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for key, limit, color in active_providers:
+                    executor.submit(self._run_provider_search, key, limit, color)
+        finally:
+            self._drain_job_queue()
+
+    def _drain_job_queue(self) -> None:
+        """Moves every batch queued by the provider threads into jobs_data."""
+        with self.data_lock:
+            while True:
+                try:
+                    self.jobs_data.extend(self._job_queue.get_nowait())
+                except Empty:
+                    break
 
     def _run_provider_search(self, provider_key: str, limit: int, color: str) -> None:
         """Generic provider runner with optimized individual location support."""
@@ -381,65 +651,89 @@ class JobSearchEngine:
         print(f"{color} {display_name}: Started ({loc_count} locations)")
         delay = self.config.get("api_settings", {}).get("delay_between_requests", 2)
 
-        for q in queries:
-            current_locs = target_locs if supports_location else ["All Locations"]
-            for loc in current_locs:
-                success, attempts = False, 0
-                max_attempts = 1 if supports_location else self.MAX_RETRIES_PER_QUERY
-                while not success and attempts < max_attempts:
-                    try:
-                        if attempts > 0:
-                            time.sleep(delay * 2)
-                        search_loc = loc if supports_location else (target_locs if target_locs else "Default")
-                        jobs = provider_instance.search(q, search_loc, limit)
-                        if jobs:
-                            with self.data_lock:
-                                self.jobs_data.extend(jobs)
-                            print(f"   ✓ [{display_name}] +{len(jobs)} jobs (Q: {q} | L: {loc})")
-                            success = True
-                        elif not supports_location:
+        try:
+            for q in queries:
+                current_locs = target_locs if supports_location else ["All Locations"]
+                for loc in current_locs:
+                    success, attempts = False, 0
+                    max_attempts = 1 if supports_location else self.MAX_RETRIES_PER_QUERY
+                    while not success and attempts < max_attempts:
+                        try:
+                            if attempts > 0:
+                                time.sleep(delay * 2)
+                            search_loc = loc if supports_location else (target_locs if target_locs else "Default")
+                            jobs = provider_instance.search(q, search_loc, limit)
+                            if jobs:
+                                self._job_queue.put(jobs)
+                                print(f"   ✓ [{display_name}] +{len(jobs)} jobs (Q: {q} | L: {loc})")
+                                success = True
+                            elif not supports_location:
+                                attempts += 1
+                            else:
+                                print(f"   ✓ [{display_name}] 0 jobs (Q: {q} | L: {loc})")
+                                success = True
+                        except Exception as e:
+                            print(f"   ⚠️ [{display_name}] Error: {e}")
                             attempts += 1
-                        else:
-                            print(f"   ✓ [{display_name}] 0 jobs (Q: {q} | L: {loc})")
-                            success = True
-                    except Exception as e:
-                        print(f"   ⚠️ [{display_name}] Error: {e}")
-                        attempts += 1
-                time.sleep(delay)
+                    time.sleep(delay)
+        finally:
+            self._close_provider(provider_instance)
+
+    @staticmethod
+    def _close_provider(provider: object) -> None:
+        """Releases resources a provider keeps between calls (e.g. a cached browser)."""
+        close = getattr(provider, "close", None)
+        if callable(close):
+            with contextlib.suppress(Exception):
+                close()
 
     def remove_duplicates(self) -> None:
         """Executes Phase 2: Deduplication."""
-        seen, unique = set(), []
+        # Runs after all searches finished, so the lock only guards the copy and the swap
+        by_key: Dict[str, Dict[str, Any]] = {}
+        for j in self._snapshot_jobs():
+            # First occurrence wins; dict keeps insertion order
+            by_key.setdefault(str(j.get("job_id") or j.get("link")), j)
         with self.data_lock:
-            for j in self.jobs_data:
-                jid = str(j.get("job_id") or j.get("link"))
-                if jid not in seen:
-                    seen.add(jid)
-                    unique.append(j)
-            self.jobs_data = unique
+            self.jobs_data = list(by_key.values())
         print(f"🗑️ PHASE 2: DEDUPLICATION -> {len(self.jobs_data)} unique jobs")
 
+    def _should_fetch_descriptions(self) -> bool:
+        """Returns True when Phase 3 fetches full descriptions (always in manual mode)."""
+        return self.is_manual_mode or bool(
+            self.config.get("search_parameters", {}).get("fetch_full_description", False)
+        )
+
     def fetch_full_descriptions(self) -> None:
         """Executes Phase 3: Enrichment with session-based Selenium for Manual Mode."""
-        should_fetch = self.is_manual_mode or self.config.get("search_parameters", {}).get(
-            "fetch_full_description", False
-        )
-        if not should_fetch:
+        if not self._should_fetch_descriptions():
             return
         workers = 1 if self.is_manual_mode else self.MAX_WORKERS_ENRICH
         print(f"\n{'-' * 75}\n📥 PHASE 3: ENRICHMENT ({workers} workers)\n{'-' * 75}")
 
         if workers > 1:
+            # Keep at most two jobs per worker in flight instead of one Future per job
+            max_pending = workers * 2
             with ThreadPoolExecutor(max_workers=workers) as executor:
-                futures = [executor.submit(self._enrich_single_job, j) for j in self.jobs_data]
-                for f in as_completed(futures):
-                    with contextlib.suppress(Exception):
-                        f.result()
+                pending: Set[Future] = set()
+                for j in self.jobs_data:
+                    if len(pending) >= max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        self._collect_enrichment(done)
+                    pending.add(executor.submit(self._enrich_single_job, j))
+                self._collect_enrichment(as_completed(pending))
         else:
             for job in self.jobs_data:
                 with contextlib.suppress(Exception):
                     self._enrich_single_job(job)
 
+    @staticmethod
+    def _collect_enrichment(futures: Iterable[Future]) -> None:
+        """Consumes finished enrichment futures; per-job failures are ignored as before."""
+        for f in futures:
+            with contextlib.suppress(Exception):
+                f.result()
+
     def _enrich_single_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """Fetches and enriches job data with rich metadata support."""
         if self.is_manual_mode:
@@ -457,6 +751,7 @@ class JobSearchEngine:
                     job.update(raw_result)
                 else:
                     job["description"] = raw_result
+            self._close_provider(provider)
 
         # RE-CALCULATE EVERYTHING AFTER METADATA UPDATE
         self._enrich_job_data(job)
@@ -469,88 +764,134 @@ class JobSearchEngine:
 
     def get_csv_headers(self) -> List[str]:
         """Returns CSV headers."""
-        return [
-            "relevance_score",
-            "search_criteria",
-            "provider",
-            "title",
-            "company",
-            "location",
-            "work_location_type",
-            "employment_type",
-            "matching_skills",
-            "missing_skills",
-            "detected_languages",
-            "matched_roles",
-            "salary_hint",
-            "posted_at_relative",
-            "link",
-            "scraped_at",
-        ]
+        return list(CSV_HEADERS)
+
+    @staticmethod
+    def _csv_row(job: Dict[str, Any]) -> List[Any]:
+        """Projects a job onto the CSV columns (missing fields become empty cells)."""
+        return [job.get(h, "") for h in CSV_HEADERS]
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _atomic_open(path: Path) -> Iterator[TextIO]:
+        """Opens a temp file for CSV writing and moves it over `path` only once fully written."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with tmp_path.open("w", newline="", encoding="utf-8") as f:
+                yield f
+            tmp_path.replace(path)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                tmp_path.unlink()
+
+    def _snapshot_jobs(self) -> List[Dict[str, Any]]:
+        """Returns a shallow copy of the job list, holding the lock only for the copy."""
+        with self.data_lock:
+            return list(self.jobs_data)
 
-    def save_raw_data(self, silent: bool = True) -> None:
+    def save_raw_data(self, silent: bool = True, snapshot: Optional[List[Dict[str, Any]]] = None) -> None:
         """Saves all raw results."""
-        with self.data_lock:
-            data_copy = list(self.jobs_data)
+        data_copy = snapshot if snapshot is not None else self._snapshot_jobs()
         if not data_copy:
             return
         if not silent:
             print("💾 Saving raw data...")
         formats = self.config.get("output", {}).get("formats", ["csv"])
         if "csv" in formats:
-            with (self.output_dir / "all_jobs_raw.csv").open("w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=self.get_csv_headers(), extrasaction="ignore")
-                writer.writeheader()
-                writer.writerows(data_copy)
+            with self._atomic_open(self.output_dir / "all_jobs_raw.csv") as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_HEADERS)
+                writer.writerows(map(self._csv_row, data_copy))
         if "json" in formats:
-            with (self.output_dir / "all_jobs_raw.json").open("w", encoding="utf-8") as f:
-                json.dump(data_copy, f, ensure_ascii=False, indent=2)
+            self._dump_json(self.output_dir / "all_jobs_raw.json", data_copy)
 
-    def autosave_filtered(self, silent: bool = True) -> None:
+    def autosave_filtered(self, silent: bool = True, snapshot: Optional[List[Dict[str, Any]]] = None) -> None:
         """Saves filtered results."""
-        with self.data_lock:
-            data_copy = list(self.jobs_data)
+        data_copy = snapshot if snapshot is not None else self._snapshot_jobs()
         if not data_copy:
             return
+        keep = self._job_filter()
+        self._write_filtered([j for j in data_copy if keep(j)], silent)
+
+    def _write_all_outputs(self, snapshot: List[Dict[str, Any]]) -> None:
+        """Writes raw and filtered outputs while walking the job snapshot only once."""
+        if not snapshot:
+            return
+        print("💾 Saving raw data...")
+        formats = self.config.get("output", {}).get("formats", ["csv"])
+        keep = self._job_filter()
+        filtered = []
+        with contextlib.ExitStack() as stack:
+            raw_writer = None
+            if "csv" in formats:
+                f = stack.enter_context(self._atomic_open(self.output_dir / "all_jobs_raw.csv"))
+                raw_writer = csv.writer(f)
+                raw_writer.writerow(CSV_HEADERS)
+            for j in snapshot:
+                if raw_writer is not None:
+                    raw_writer.writerow(self._csv_row(j))
+                if keep(j):
+                    filtered.append(j)
+        if "json" in formats:
+            self._dump_json(self.output_dir / "all_jobs_raw.json", snapshot)
+        self._write_filtered(filtered, silent=False)
+
+    def _job_filter(self) -> Callable[[Dict[str, Any]], bool]:
+        """Builds the min-score / excluded-title predicate for the filtered outputs."""
         min_s = 0 if self.is_manual_mode else self.config.get("filtering", {}).get("min_relevance_score", 0)
-        exclude = self.config.get("filtering", {}).get("exclude_keywords", [])
-        filtered = [
-            j
-            for j in data_copy
-            if j.get("relevance_score", 0) >= min_s
-            and not any(k.lower() in j.get("title", "").lower() for k in exclude)
-        ]
+        exclude = tuple(k.lower() for k in self.config.get("filtering", {}).get("exclude_keywords", []))
+
+        def keep(job: Dict[str, Any]) -> bool:
+            if job.get("relevance_score", 0) < min_s:
+                return False
+            title_lower = job.get("title", "").lower()
+            return not any(k in title_lower for k in exclude)
+
+        return keep
+
+    def _write_filtered(self, filtered: List[Dict[str, Any]], silent: bool) -> None:
+        """Sorts the filtered jobs by score and writes them in every configured format."""
         filtered.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
         if not silent:
             print(f"💾 Saving filtered results ({len(filtered)} jobs)...")
         base = self.config.get("output", {}).get("base_filename", "jobs")
         formats = self.config.get("output", {}).get("formats", ["csv"])
         if "csv" in formats and filtered:
-            with (self.output_dir / f"{base}.csv").open("w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=self.get_csv_headers(), extrasaction="ignore")
-                writer.writeheader()
-                writer.writerows(filtered)
+            with self._atomic_open(self.output_dir / f"{base}.csv") as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_HEADERS)
+                writer.writerows(map(self._csv_row, filtered))
         if "json" in formats and filtered:
-            with (self.output_dir / f"{base}.json").open("w", encoding="utf-8") as f:
-                json.dump(filtered, f, ensure_ascii=False, indent=2)
+            self._dump_json(self.output_dir / f"{base}.json", filtered)
         if "markdown" in formats and filtered:
             self._export_markdown(base, filtered)
 
+    @staticmethod
+    def _dump_json(path: Path, data: List[Dict[str, Any]]) -> None:
+        """Writes jobs as indented UTF-8 JSON, using orjson when it is installed."""
+        if HAS_ORJSON:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
     def _export_markdown(self, base_name: str, data: List[Dict[str, Any]]) -> None:
         """Generates MD report."""
         now_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        with (self.output_dir / f"{base_name}.md").open("w", encoding="utf-8") as f:
-            f.write(f"# Job Search Results ({now_str})\n\nTotal processed: {len(data)}\n\n")
-            for i, j in enumerate(data, 1):
-                f.write(f"### {i}. {j.get('title', 'Unknown')} (**{j.get('relevance_score', 0)}%**)\n")
-                f.write(f"- **Provider:** {j.get('provider')} | **Location:** {j.get('location')}\n")
-                f.write(f"- **Matching Skills:** {j.get('matching_skills', 'None')}\n")
-                f.write(f"- **Link:** [View Posting]({j['link']})\n\n---\n")
-
-    def generate_report(self) -> None:
+        parts = [f"# Job Search Results ({now_str})\n\nTotal processed: {len(data)}\n\n"]
+        parts.extend(
+            f"### {i}. {j.get('title', 'Unknown')} (**{j.get('relevance_score', 0)}%**)\n"
+            f"- **Provider:** {j.get('provider')} | **Location:** {j.get('location')}\n"
+            f"- **Matching Skills:** {j.get('matching_skills', 'None')}\n"
+            f"- **Link:** [View Posting]({j['link']})\n\n---\n"
+            for i, j in enumerate(data, 1)
+        )
+        # Buffer the whole report and hand it to the file in a single write
+        (self.output_dir / f"{base_name}.md").write_text("".join(parts), encoding="utf-8")
+
+    def generate_report(self, snapshot: Optional[List[Dict[str, Any]]] = None) -> None:
         """Final summary print."""
-        with self.data_lock:
-            data_copy = list(self.jobs_data)
+        data_copy = snapshot if snapshot is not None else self._snapshot_jobs()
         filtered = sorted(data_copy, key=lambda x: x.get("relevance_score", 0), reverse=True)
         if not filtered:
             return
@@ -564,4 +905,4 @@ class JobSearchEngine:
             print(msg)
 
 
-# End of src/core/engine.py (v. 00052)
+# End of src/core/engine.py (v. 00087)
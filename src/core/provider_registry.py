@@ -7,92 +7,106 @@
 This module acts as a Factory/Registry for all available job providers.
 It decouples the main Engine from specific provider implementations and
 provides logic to identify providers based on URL patterns.
-Refactored (v. 00027) - Enhancement: Added URL-to-Provider mapping logic.
+Refactored (v. 00033) - Performance: Provider keys and display names are
+normalized into one alias table at import, so get_provider_instance resolves any
+spelling with one lookup.
 """
 
-from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, Union
+import importlib
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple, Type, Union, cast
+from urllib.parse import urlsplit
 
 import requests
 
-# Import all provider classes
-from src.core.providers.ferchau import FerchauProvider
-from src.core.providers.freelance_de import FreelanceDeProvider
-from src.core.providers.freelancermap import FreelancermapProvider
-from src.core.providers.gulp import GulpProvider
-from src.core.providers.hays import HaysProvider
-from src.core.providers.linkedin import LinkedInProvider
-from src.core.providers.solcom import SolcomProvider
-from src.core.providers.xing import XingProvider
+if TYPE_CHECKING:
+    # Provider modules pull in Selenium/BS4 and are imported on first use only
+    from src.core.providers.ferchau import FerchauProvider
+    from src.core.providers.freelance_de import FreelanceDeProvider
+    from src.core.providers.freelancermap import FreelancermapProvider
+    from src.core.providers.gulp import GulpProvider
+    from src.core.providers.hays import HaysProvider
+    from src.core.providers.linkedin import LinkedInProvider
+    from src.core.providers.solcom import SolcomProvider
+    from src.core.providers.xing import XingProvider
 
 # Define a Union type for all supported provider instances
 JobProvider = Union[
-    LinkedInProvider,
-    HaysProvider,
-    SolcomProvider,
-    FreelancermapProvider,
-    XingProvider,
-    GulpProvider,
-    FreelanceDeProvider,
-    FerchauProvider,
+    "LinkedInProvider",
+    "HaysProvider",
+    "SolcomProvider",
+    "FreelancermapProvider",
+    "XingProvider",
+    "GulpProvider",
+    "FreelanceDeProvider",
+    "FerchauProvider",
 ]
 
 
 class ProviderRegistry:
     """Central registry for managing job provider classes and metadata."""
 
-    # Configuration map: Key matches the 'active_providers' key in JSON config
+    # Configuration map: Key matches the 'active_providers' key in JSON config.
+    # Provider classes are referenced by module path and resolved lazily by _get_provider_class.
     _REGISTRY: ClassVar[Dict[str, Dict[str, Any]]] = {
         "linkedin": {
-            "class": LinkedInProvider,
+            "module": "src.core.providers.linkedin",
+            "class_name": "LinkedInProvider",
             "color": "🔵",
             "default_limit": 25,
             "display_name": "LinkedIn",
             "domain_pattern": "linkedin.com",
         },
         "hays": {
-            "class": HaysProvider,
+            "module": "src.core.providers.hays",
+            "class_name": "HaysProvider",
             "color": "🔴",
             "default_limit": 20,
             "display_name": "Hays",
             "domain_pattern": "hays.de",
         },
         "solcom": {
-            "class": SolcomProvider,
+            "module": "src.core.providers.solcom",
+            "class_name": "SolcomProvider",
             "color": "🟠",
             "default_limit": 20,
             "display_name": "SOLCOM",
             "domain_pattern": "solcom.de",
         },
         "freelancermap": {
-            "class": FreelancermapProvider,
+            "module": "src.core.providers.freelancermap",
+            "class_name": "FreelancermapProvider",
             "color": "🟢",
             "default_limit": 20,
             "display_name": "Freelancermap",
             "domain_pattern": "freelancermap.de",
         },
         "xing": {
-            "class": XingProvider,
+            "module": "src.core.providers.xing",
+            "class_name": "XingProvider",
             "color": "🟣",
             "default_limit": 15,
             "display_name": "XING",
             "domain_pattern": "xing.com",
         },
         "gulp": {
-            "class": GulpProvider,
+            "module": "src.core.providers.gulp",
+            "class_name": "GulpProvider",
             "color": "🟡",
             "default_limit": 15,
             "display_name": "GULP",
             "domain_pattern": "gulp.de",
         },
         "freelance_de": {
-            "class": FreelanceDeProvider,
+            "module": "src.core.providers.freelance_de",
+            "class_name": "FreelanceDeProvider",
             "color": "💠",
             "default_limit": 15,
             "display_name": "Freelance.de",
             "domain_pattern": "freelance.de",
         },
         "ferchau": {
-            "class": FerchauProvider,
+            "module": "src.core.providers.ferchau",
+            "class_name": "FerchauProvider",
             "color": "⚙️",
             "default_limit": 10,
             "display_name": "FERCHAU",
@@ -100,6 +114,15 @@ class ProviderRegistry:
         },
     }
 
+    # Registered domain -> provider key, for host lookups without scanning the registry
+    _DOMAIN_INDEX: ClassVar[Dict[str, str]] = {meta["domain_pattern"]: key for key, meta in _REGISTRY.items()}
+
+    # Every accepted spelling (lowercased display name or key) -> provider key, normalized once at import
+    _ALIAS_TO_KEY: ClassVar[Dict[str, str]] = {
+        **{meta["display_name"].lower(): key for key, meta in _REGISTRY.items()},
+        **{key.lower(): key for key in _REGISTRY},
+    }
+
     @classmethod
     def get_active_providers(cls, config: Dict[str, Any]) -> List[Tuple[str, int, str]]:
         """Parses config and returns a list of enabled providers to run.
@@ -132,20 +155,29 @@ class ProviderRegistry:
         Returns:
             An instance of the provider class, or None if key is invalid.
         """
-        key = provider_key.lower()
+        # Accepts the key or the display name in any case
+        key = cls._ALIAS_TO_KEY.get(provider_key.lower())
+        if key is None:
+            return None
 
-        # Reverse lookup by display name if key not found
-        if key not in cls._REGISTRY:
-            for k, v in cls._REGISTRY.items():
-                if v["display_name"].lower() == key:
-                    key = k
-                    break
+        return cls._get_provider_class(cls._REGISTRY[key])(session)
 
-        if key in cls._REGISTRY:
-            provider_cls: Type[JobProvider] = cls._REGISTRY[key]["class"]
-            return provider_cls(session)
+    @staticmethod
+    def _get_provider_class(entry: Dict[str, Any]) -> Type[JobProvider]:
+        """Imports the provider module on first use and memoizes the class in the registry.
 
-        return None
+        Args:
+            entry: A _REGISTRY entry.
+
+        Returns:
+            The provider class.
+        """
+        provider_cls = entry.get("class")
+        if provider_cls is None:
+            module = importlib.import_module(entry["module"])
+            provider_cls = getattr(module, entry["class_name"])
+            entry["class"] = provider_cls
+        return cast(Type[JobProvider], provider_cls)
 
     @classmethod
     def get_provider_key_from_url(cls, url: str) -> Optional[str]:
@@ -158,6 +190,19 @@ class ProviderRegistry:
             The provider key (e.g., 'gulp') or None if no match is found.
         """
         url_lower = url.lower()
+
+        # Fast path: match the host and its parent domains (www.gulp.de -> gulp.de) in the index
+        try:
+            host = urlsplit(url_lower).hostname or ""
+        except ValueError:  # Malformed netloc (e.g. unbalanced IPv6 brackets)
+            host = ""
+        labels = host.split(".")
+        for i in range(len(labels) - 1):
+            key = cls._DOMAIN_INDEX.get(".".join(labels[i:]))
+            if key:
+                return key
+
+        # Fallback for scheme-less or unusual URLs: substring scan as before
         for key, meta in cls._REGISTRY.items():
             if meta["domain_pattern"] in url_lower:
                 return key
@@ -172,9 +217,14 @@ class ProviderRegistry:
     def get_scraping_method(cls, provider_key: str) -> str:
         """Returns the scraping method description."""
         entry = cls._REGISTRY.get(provider_key)
-        if entry:
-            return getattr(entry["class"], "SCRAPING_METHOD", "Unknown")
-        return "Unknown"
+        if entry is None:
+            return "Unknown"
+        # Class attributes never change at runtime; resolve once and keep it with the entry
+        method = entry.get("scraping_method")
+        if method is None:
+            method = str(getattr(cls._get_provider_class(entry), "SCRAPING_METHOD", "Unknown"))
+            entry["scraping_method"] = method
+        return cast(str, method)
 
 
-# End of src/core/provider_registry.py (v. 00027)
+# End of src/core/provider_registry.py (v. 00033)
@@ -6,11 +6,12 @@
 
 This module handles searching and data extraction from the modern FERCHAU
 Touch portal (touch.ferchau.com) using the centralized SeleniumFactory.
-Refactored (v. 00012) - Consistency: Updated detail fetch to return full
-metadata (work type, employment) to ensure parity between manual and auto modes.
+Refactored (v. 00024) - Performance: The logs directory is created once per
+process instead of on every provider instantiation.
 """
 
 import contextlib
+import hashlib
 import json
 import random
 import re
@@ -28,6 +29,27 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from src.core.selenium_factory import SeleniumFactory
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # Optional speed-up, stdlib json is the fallback
+    HAS_ORJSON = False
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:  # Optional speed-up, the built-in html.parser is the fallback
+    HTML_PARSER = "html.parser"
+
+# Page-level patterns compiled once at import
+_DETAIL_ID_RE = re.compile(r"/job/(\d+)/")
+
+# Offer type normalization: employment / workplace names that map to Full-time / Remote
+_FULLTIME_RE = re.compile(r"Vollzeit|Full")
+_REMOTE_RE = re.compile(r"Remote|Mobil")
+
 
 class FerchauProvider:
     """Provider implementation for the modern FERCHAU Touch portal."""
@@ -38,6 +60,13 @@ class FerchauProvider:
 
     SUPPORTS_LOCATION_FILTER: bool = True
 
+    # Search pages change at most hourly; their App.Data is cached on disk for this long
+    CACHE_DIR: Path = Path("logs/cache")
+    CACHE_TTL_SECONDS: int = 3600
+
+    # The logs directory only needs to be ensured once per process, not per instance
+    _logs_ready: ClassVar[bool] = False
+
     LOCATION_MAP: ClassVar[Dict[str, str]] = {
         "Germany": "Deutschland",
         "Austria": "Österreich",
@@ -49,7 +78,11 @@ class FerchauProvider:
     def __init__(self, session: requests.Session) -> None:
         """Initializes the FERCHAU provider."""
         self.session = session
-        Path("logs").mkdir(parents=True, exist_ok=True)
+        # One Chrome instance per provider, reused across searches until close()
+        self._driver: Optional[uc.Chrome] = None
+        if not FerchauProvider._logs_ready:
+            Path("logs").mkdir(parents=True, exist_ok=True)
+            FerchauProvider._logs_ready = True
 
     def search(self, keywords: str, location: str, limit: int = 15) -> List[Dict[str, Any]]:
         """Searches for jobs on touch.ferchau.com using modern parameters."""
@@ -58,83 +91,136 @@ class FerchauProvider:
 
         query_url = f"{self.BASE_URL}?type=3&searchTerm={keywords}&location={localized_loc}&sortingType=relevance"
 
-        driver: Optional[uc.Chrome] = None
+        url_hash = hashlib.blake2b(query_url.encode("utf-8"), digest_size=16).hexdigest()
+        cache_path = self.CACHE_DIR / f"ferchau_{url_hash}.json"
+        raw_json = self._load_cached_app_data(cache_path)
+        if raw_json is not None:
+            print(f"   [TRACE] [FERCHAU] Using cached results for: {query_url}")
+            return self._parse_app_data(raw_json, keywords, location, limit=limit)
+
         try:
-            driver = SeleniumFactory.setup_driver()
+            driver = self._get_driver()
             print(f"   [TRACE] [FERCHAU] Navigating to: {query_url}")
             driver.get(query_url)
 
-            # S311: Human-like delay (noqa)
-            time.sleep(random.uniform(4, 6))  # noqa: S311
+            self._wait_until_loaded(driver)
             self._handle_cookies(driver)
 
             with contextlib.suppress(Exception):
                 WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.CLASS_NAME, "search-result__offer")))
 
-            found_jobs = self._extract_from_app_data(driver.page_source, keywords, location)
+            raw_json = self._find_app_data(driver.page_source)
+            if raw_json:
+                found_jobs = self._parse_app_data(raw_json, keywords, location, limit=limit)
+                if found_jobs:
+                    self._store_cached_app_data(cache_path, raw_json)
 
         except Exception as e:
             print(f"   [DEBUG] [FERCHAU] Global search error: {e}")
-        finally:
-            if driver:
-                self._safe_quit(driver)
+            # The browser may be in a broken state; the next call starts a fresh one
+            self.close()
 
-        return found_jobs[:limit]
+        return found_jobs
 
     def _extract_from_app_data(
-        self, html: str, query: str, req_loc: str, target_id: Optional[str] = None
+        self, html: str, query: str, req_loc: str, target_id: Optional[str] = None, limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Parses the 'App.Data' JSON object injected into the page."""
+        raw_json = self._find_app_data(html)
+        if not raw_json:
+            return []
+        return self._parse_app_data(raw_json, query, req_loc, target_id, limit)
+
+    @staticmethod
+    def _find_app_data(html: str) -> Optional[str]:
+        """Returns the raw 'App.Data' JSON text of a page, or None if it is missing.
+
+        Takes the first "{" after "App.Data =" up to the first following "};", as the
+        former DOTALL regex did, but scans the page with str.find instead of the regex engine.
+        """
+        marker = "App.Data"
+        pos = html.find(marker)
+        while pos >= 0:
+            i = pos + len(marker)
+            while i < len(html) and html[i].isspace():
+                i += 1
+            if html.startswith("=", i):
+                i += 1
+                while i < len(html) and html[i].isspace():
+                    i += 1
+                if html.startswith("{", i):
+                    end = html.find("};", i + 1)
+                    return html[i : end + 1] if end >= 0 else None
+            pos = html.find(marker, pos + 1)
+        return None
+
+    def _load_cached_app_data(self, cache_path: Path) -> Optional[str]:
+        """Returns App.Data cached for a search URL if it is younger than CACHE_TTL_SECONDS."""
+        with contextlib.suppress(Exception):
+            entry = json.loads(cache_path.read_text(encoding="utf-8"))
+            if time.time() - float(entry["ts"]) < self.CACHE_TTL_SECONDS:
+                return str(entry["app_data"])
+        return None
+
+    def _store_cached_app_data(self, cache_path: Path, raw_json: str) -> None:
+        """Caches the App.Data of a search page; failures only cost the cache hit."""
+        with contextlib.suppress(OSError):
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({"ts": time.time(), "app_data": raw_json}), encoding="utf-8")
+
+    def _parse_app_data(
+        self, raw_json: str, query: str, req_loc: str, target_id: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Converts the offers of an App.Data JSON text into job dictionaries (at most `limit`)."""
         results = []
         try:
-            pattern = r"App\.Data\s*=\s*(\{.*?\});"
-            match = re.search(pattern, html, re.DOTALL)
-            if not match:
-                return []
-
-            raw_json = match.group(1)
-            data = json.loads(raw_json)
+            data = orjson.loads(raw_json) if HAS_ORJSON else json.loads(raw_json)
             offers = data.get("ControllerResponse", {}).get("Data", {}).get("Offers", [])
 
             if target_id:
                 offers = sorted(offers, key=lambda x: str(x.get("id")) == target_id, reverse=True)
+            if limit is not None:
+                # Offers beyond the limit would be dropped by the caller; do not build them
+                offers = offers[:limit]
+
+            # Shared by every offer of the page
+            scraped_at = datetime.now(timezone.utc).isoformat()
+            search_criteria = f"{query} | {req_loc}"
 
             for offer in offers:
-                title = str(offer.get("title", "")).replace("\u00ad", "").strip()
-                description_parts = [
-                    offer.get("intro", ""),
-                    offer.get("tasks", ""),
-                    offer.get("requirements", ""),
-                    offer.get("benefits", ""),
-                ]
-                clean_desc = BeautifulSoup(" ".join(description_parts), "html.parser").get_text(
-                    separator="\n", strip=True
-                )
+                g = offer.get  # bound once, used for every field below
+                title = str(g("title", "")).replace("\u00ad", "").strip()
+                raw_desc = " ".join((g("intro", ""), g("tasks", ""), g("requirements", ""), g("benefits", "")))
+                if "<" in raw_desc or "&" in raw_desc:
+                    clean_desc = BeautifulSoup(raw_desc, HTML_PARSER).get_text(separator="\n", strip=True)
+                else:
+                    # No tags or entities: the parse tree would be a single text node
+                    clean_desc = raw_desc.strip()
 
                 # Standardize employment and work location types
-                raw_emp = offer.get("jobTypeName", "Full-time")
-                emp_type = "Full-time" if "Vollzeit" in raw_emp or "Full" in raw_emp else raw_emp
+                raw_emp = g("jobTypeName", "Full-time")
+                emp_type = "Full-time" if _FULLTIME_RE.search(raw_emp) else raw_emp
                 if "Freiberuflich" in raw_emp:
                     emp_type = "Freelance"
 
-                raw_work = offer.get("workplaceTypeName", "Hybrid")
-                work_type = "Remote" if "Remote" in raw_work or "Mobil" in raw_work else raw_work
+                raw_work = g("workplaceTypeName", "Hybrid")
+                work_type = "Remote" if _REMOTE_RE.search(raw_work) else raw_work
 
                 results.append(
                     {
                         "title": title,
                         "company": "FERCHAU",
-                        "location": f"{offer.get('locationCity', '')} {offer.get('locationCountry', '')}".strip(),
-                        "link": f"https://touch.ferchau.com{offer.get('slug', '')}",
-                        "job_id": str(offer.get("id")),
+                        "location": f"{g('locationCity', '')} {g('locationCountry', '')}".strip(),
+                        "link": f"https://touch.ferchau.com{g('slug', '')}",
+                        "job_id": str(g("id")),
                         "provider": "ferchau",
                         "posted_at_relative": "Recent",
-                        "scraped_at": datetime.now(timezone.utc).isoformat(),
+                        "scraped_at": scraped_at,
                         "description": clean_desc,
                         "relevance_score": 0,
                         "work_location_type": work_type,
                         "employment_type": emp_type,
-                        "search_criteria": f"{query} | {req_loc}",
+                        "search_criteria": search_criteria,
                     }
                 )
         except Exception as e:
@@ -144,16 +230,15 @@ class FerchauProvider:
 
     def fetch_full_description(self, url: str) -> Union[str, Dict[str, str]]:
         """Fetches full description and metadata for a single URL."""
-        id_match = re.search(r"/job/(\d+)/", url)
+        id_match = _DETAIL_ID_RE.search(url)
         target_id = id_match.group(1) if id_match else None
 
-        driver: Optional[uc.Chrome] = None
         try:
-            driver = SeleniumFactory.setup_driver()
+            driver = self._get_driver()
             driver.get(url)
-            time.sleep(4)
+            self._wait_until_loaded(driver)
 
-            jobs = self._extract_from_app_data(driver.page_source, "Manual", "N/A", target_id=target_id)
+            jobs = self._extract_from_app_data(driver.page_source, "Manual", "N/A", target_id=target_id, limit=1)
             if jobs:
                 # Return dictionary to overwrite defaults in manual mode
                 return {
@@ -166,12 +251,35 @@ class FerchauProvider:
                 }
         except Exception as e:
             print(f"   [DEBUG] [FERCHAU] Detail fetch error: {e}")
-        finally:
-            if driver:
-                self._safe_quit(driver)
+            self.close()
 
         return ""
 
+    def _get_driver(self) -> uc.Chrome:
+        """Returns the provider's browser, starting it on first use.
+
+        Cookies are cleared on reuse so every request starts from a clean session.
+        """
+        if self._driver is None:
+            self._driver = SeleniumFactory.setup_driver()
+        else:
+            with contextlib.suppress(Exception):
+                self._driver.delete_all_cookies()
+        return self._driver
+
+    def close(self) -> None:
+        """Quits the cached browser, if one was started."""
+        if self._driver is not None:
+            self._safe_quit(self._driver)
+            self._driver = None
+
+    def _wait_until_loaded(self, driver: uc.Chrome) -> None:
+        """Waits for the document to finish loading, then adds a short human-like pause."""
+        with contextlib.suppress(Exception):
+            WebDriverWait(driver, 8).until(lambda d: d.execute_script("return document.readyState") == "complete")
+        # S311: Human-like delay (noqa)
+        time.sleep(random.uniform(0.3, 0.8))  # noqa: S311
+
     def _handle_cookies(self, driver: uc.Chrome) -> None:
         """Attempts to accept cookie consent."""
         with contextlib.suppress(Exception):
@@ -186,4 +294,4 @@ class FerchauProvider:
             driver.quit()
 
 
-# End of src/core/providers/ferchau.py (v. 00012)
+# End of src/core/providers/ferchau.py (v. 00024)
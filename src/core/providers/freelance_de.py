@@ -6,39 +6,94 @@
 
 This module handles searching and data extraction from Freelance.de using
 the centralized SeleniumFactory. Based on the stable v36 architecture.
-Refactored (v. 00055) - Precision: Added skill badge scraping to Detail Fetch
-to ensure parity in scoring between Manual and Auto modes.
+Refactored (v. 00069) - Performance: Page HTML is read once per check via CDP
+DOM.getOuterHTML, falling back to page_source.
 """
 
+import atexit
 import contextlib
+import functools
 import json
 import random
 import re
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, ClassVar, Dict, List, Optional, Union
+from queue import Empty, SimpleQueue
+from threading import Lock
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 import requests
 import undetected_chromedriver as uc  # type: ignore
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
+from requests.cookies import RequestsCookieJar
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from src.core.selenium_factory import SeleniumFactory
 
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:  # Optional speed-up, the built-in html.parser is the fallback
+    HTML_PARSER = "html.parser"
+
+# Result cards are <search-project-card> (current layout) or div.project-item (legacy layout);
+# everything else (head, scripts, navigation) is skipped while parsing. Matched elements keep their subtree.
+_CARD_STRAINER = SoupStrainer("search-project-card")
+# The class is matched as a whole word in the raw attribute, which may hold several classes at parse time
+_LEGACY_CARD_STRAINER = SoupStrainer("div", class_=re.compile(r"(?:^|\s)project-item(?:\s|$)"))
+
+# Class / href patterns used per card and per detail page, compiled once at import
+_LINK_RE = re.compile(r"project\.php|projekte/")
+_META_UL_RE = re.compile(r"fa-ul|icon-list")
+_META_UL_DETAIL_RE = re.compile(r"fa-ul|icon-list|overview")
+_SKILL_RE = re.compile(r"badge|tag|skill")
+
+# Metadata row markers, shared by the card parser and the detail page
+_LOCATION_ICONS = ("fa-map-marker", "fa-location")
+_REMOTE_KEYWORDS = ("remote", "home office")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_credentials(path: str, mtime_ns: int) -> Tuple[Optional[str], Optional[str]]:  # noqa: ARG001
+    """Reads the Freelance.de login from the profile once per file version (mtime is the cache key)."""
+    profile = json.loads(Path(path).read_text(encoding="utf-8"))
+    creds = profile.get("credentials", {})
+    return creds.get("freelance_de_user"), creds.get("freelance_de_pass")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_cookies(path: str, mtime_ns: int) -> Tuple[Dict[str, Any], ...]:  # noqa: ARG001
+    """Parses the saved session cookies once per file version (mtime is the cache key)."""
+    with Path(path).open("r", encoding="utf-8") as f:
+        return tuple(json.load(f))
+
+
+def _icon_classes(li: Tag) -> str:
+    """Returns the CSS classes of a list item and its descendants as one space-joined string.
+
+    Metadata rows are told apart by their Font Awesome icon (fa-map-marker, fa-calendar, ...);
+    checking the class names avoids serializing the whole <li> with str().
+    """
+    return " ".join(c for tag in (li, *li.find_all(True)) for c in tag.get("class") or ())
+
 
 class FreelanceDeJobParser:
     """Helper class to parse a single search-project-card from Freelance.de."""
 
-    def __init__(self, card: Tag, domain: str, query: str, req_loc: str) -> None:
+    def __init__(self, card: Tag, domain: str, query: str, req_loc: str, scraped_at: str) -> None:
         """Initializes the parser."""
         self.card = card
         self.domain = domain
         self.query = query
         self.req_loc = req_loc
+        self.scraped_at = scraped_at
         self.location = "Germany/Remote"
         self.start_date = "ASAP"
         self.company = "Freelance.de Client"
@@ -67,7 +122,7 @@ class FreelanceDeJobParser:
                 "job_id": link_data["job_id"],
                 "provider": "freelance_de",
                 "posted_at_relative": self._extract_posted_date(),
-                "scraped_at": datetime.now(timezone.utc).isoformat(),
+                "scraped_at": self.scraped_at,
                 "description": full_text_description,
                 "relevance_score": 0,
                 "work_location_type": (
@@ -82,7 +137,7 @@ class FreelanceDeJobParser:
 
     def _extract_link_info(self) -> Optional[Dict[str, str]]:
         """Safely extracts title and link from the card header."""
-        link_tag = self.card.find("a", href=re.compile(r"project\.php|projekte/"))
+        link_tag = self.card.find("a", href=_LINK_RE)
         if not isinstance(link_tag, Tag):
             return None
 
@@ -99,18 +154,19 @@ class FreelanceDeJobParser:
 
     def _extract_metadata(self) -> None:
         """Parses the icon-based metadata list."""
-        info_list = self.card.find("ul", class_=re.compile(r"fa-ul|icon-list"))
+        info_list = self.card.find("ul", class_=_META_UL_RE)
         if not isinstance(info_list, Tag):
             return
 
-        for li in info_list.find_all("li"):
+        for li in info_list.find_all("li", recursive=False):
             text = li.get_text(strip=True)
-            li_str = str(li)
-            if any(icon in li_str for icon in ["fa-map-marker", "fa-location"]):
+            text_lower = text.lower()
+            icons = _icon_classes(li)
+            if any(icon in icons for icon in _LOCATION_ICONS):
                 self.location = text.split("Premiumaccount")[0].strip()
-            elif "fa-calendar" in li_str:
+            elif "fa-calendar" in icons:
                 self.start_date = text
-            elif any(kw in text.lower() for kw in ["remote", "home office"]):
+            elif any(kw in text_lower for kw in _REMOTE_KEYWORDS):
                 self.remote_possible = True
             elif "Project Provider:" in text:
                 self.company = text.replace("Project Provider:", "").strip()
@@ -127,6 +183,11 @@ class FreelanceDeProvider:
     BASE_URL: str = "https://www.freelance.de"
     LOGIN_URL: str = "https://www.freelance.de/login.php"
     COOKIE_FILE: str = "logs/cookies_freelance_de.json"
+    PROFILE_FILE: str = "configs/my_profile/my_profile.json"
+    # Elements that signal a rendered result list / detail page; the page is parsed as soon as one appears
+    RESULTS_SELECTOR: str = "search-project-card, div.project-item"
+    DETAIL_SELECTOR: str = "#project-description, .panel-body, .project-detail-content"
+    PAGE_WAIT_SECONDS: int = 10
     SCRAPING_METHOD: str = SeleniumFactory.__doc__ or "Authenticated Selenium"
     HTTP_OK: int = 200
 
@@ -138,6 +199,13 @@ class FreelanceDeProvider:
         "Remote": "Remote",
     }
 
+    # Idle browsers shared by all instances: a call takes one (or starts one) and returns it afterwards
+    _driver_pool: ClassVar["SimpleQueue[uc.Chrome]"] = SimpleQueue()
+    _pool_lock: ClassVar[Lock] = Lock()
+    _pool_exit_hook: ClassVar[bool] = False
+    # Phase 3 fetches run in parallel threads; the shared cookie file is read and written under this lock
+    _cookie_lock: ClassVar[Lock] = Lock()
+
     def __init__(self, session: requests.Session) -> None:
         """Initializes the provider instance."""
         self.session = session
@@ -151,7 +219,7 @@ class FreelanceDeProvider:
         driver: Optional[uc.Chrome] = None
 
         try:
-            driver = SeleniumFactory.setup_driver()
+            driver = self._acquire_driver()
 
             if not self._load_session(driver) and not self._login_attempted:
                 self._login_attempted = True
@@ -160,96 +228,183 @@ class FreelanceDeProvider:
             print(f"   [TRACE] [Freelance.de] Searching for {keywords} in {location}...")
 
             self._perform_ui_search(driver, keywords, localized_loc)
-            time.sleep(random.uniform(5, 7))  # noqa: S311
+            if not self._wait_for(driver, self.RESULTS_SELECTOR):
+                time.sleep(2)
 
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            cards = soup.find_all("search-project-card") or soup.find_all("div", class_="project-item")
+            html = self._page_html(driver)
+            cards = BeautifulSoup(html, HTML_PARSER, parse_only=_CARD_STRAINER).find_all("search-project-card")
+            if not cards:
+                legacy = BeautifulSoup(html, HTML_PARSER, parse_only=_LEGACY_CARD_STRAINER)
+                cards = legacy.find_all("div", class_="project-item")
 
             if not cards:
                 self._dump_diagnostics(driver, f"fde_empty_{keywords[:5]}")
 
             print(f"   [DEBUG] [Freelance.de] Found {len(cards)} items.")
 
+            scraped_at = datetime.now(timezone.utc).isoformat()
             for card in cards[:limit]:
                 if isinstance(card, Tag):
-                    job = FreelanceDeJobParser(card, self.BASE_URL, keywords, location).parse()
+                    job = FreelanceDeJobParser(card, self.BASE_URL, keywords, location, scraped_at).parse()
                     if job:
                         found_jobs.append(job)
 
         except Exception as e:
             print(f"   [DEBUG] [Freelance.de] Global error: {e}")
-        finally:
             if driver:
+                # A browser that failed mid-call is not returned to the pool
                 self._safe_quit(driver)
+                driver = None
+        finally:
+            if driver:
+                self._release_driver(driver)
 
         return found_jobs
 
     def fetch_full_description(self, url: str) -> Union[str, Dict[str, str]]:
         """Fetches details including badges/tags to ensure scoring parity."""
-        # Initialize result
-        result: Union[str, Dict[str, str]] = ""
+        # Fast path: plain HTTP with the saved login cookies, no browser needed
+        result: Union[str, Dict[str, str]] = self._fetch_via_http(url) or ""
+        if result:
+            return result
 
         # Stagger start
         time.sleep(random.uniform(1, 5))  # noqa: S311
 
         driver: Optional[uc.Chrome] = None
         try:
-            driver = SeleniumFactory.setup_driver()
+            driver = self._acquire_driver()
             if not self._load_session(driver):
                 self._perform_login(driver)
 
             driver.get(url)
             self._handle_cookies(driver)
-            time.sleep(random.uniform(3, 5))  # noqa: S311
-
-            soup = BeautifulSoup(driver.page_source, "html.parser")
+            self._wait_for(driver, self.DETAIL_SELECTOR)
 
-            # 1. Description
-            desc = ""
-            container = (
-                soup.find("div", id="project-description")
-                or soup.find("div", class_="panel-body")
-                or soup.find("div", class_="project-detail-content")
-            )
-            if container:
-                desc = container.get_text(separator="\n", strip=True)
-
-            # FIX: Scrape Skill Tags/Badges from detail page to enrich context
-            skills = []
-            for badge in soup.find_all(class_=re.compile(r"badge|tag|skill")):
-                skills.append(badge.get_text(strip=True))
-            if skills:
-                desc += "\n\nSkills & Keywords: " + ", ".join(skills)
-
-            # 2. Title
-            title = ""
-            h1 = soup.find("h1")
-            if h1:
-                title = h1.get_text(strip=True).replace(" - freelance.de", "").split("Firmenname")[0].strip()
-
-            # 3. Metadata
-            location = "Germany/Remote"
-            company = "Freelance.de Client"
-
-            meta_ul = soup.find("ul", class_=re.compile(r"fa-ul|icon-list|overview"))
-            if meta_ul:
-                for li in meta_ul.find_all("li"):
-                    txt = li.get_text(strip=True)
-                    if any(x in str(li) for x in ["fa-map-marker", "fa-location"]):
-                        location = txt
-                    elif "fa-building" in str(li):
-                        company = txt
-
-            result = {"description": desc, "title": title, "company": company, "location": location}
+            result = self._parse_detail(BeautifulSoup(self._page_html(driver), HTML_PARSER))
 
         except Exception as e:
             print(f"   [DEBUG] [Freelance.de] Detail fetch error: {e}")
-        finally:
             if driver:
+                # A browser that failed mid-call is not returned to the pool
                 self._safe_quit(driver)
+                driver = None
+        finally:
+            if driver:
+                self._release_driver(driver)
 
         return result
 
+    def _fetch_via_http(self, url: str) -> Optional[Dict[str, str]]:
+        """Loads a detail page over HTTP, sending the saved browser cookies with this request only.
+
+        Args:
+            url: The project detail URL.
+
+        Returns:
+            Optional[Dict[str, str]]: Parsed details, or None if the page was blocked or incomplete
+            (the caller then falls back to Selenium).
+        """
+        jar = self._load_cookie_jar()
+        if jar is None:
+            return None
+        try:
+            resp = self.session.get(url, headers={"Referer": self.BASE_URL}, cookies=jar, timeout=10)
+        except requests.RequestException:
+            return None
+        if resp.status_code != self.HTTP_OK:
+            return None
+
+        soup = BeautifulSoup(resp.text, HTML_PARSER)
+        if not self._is_detail_page(soup, resp.text):
+            return None
+        return self._parse_detail(soup)
+
+    def _load_cookie_jar(self) -> Optional[RequestsCookieJar]:
+        """Builds a private cookie jar from the saved Selenium cookies.
+
+        The jar is passed per request, so the Freelance.de login never lands in the session
+        shared with the other providers. Cookies without a Freelance.de domain are skipped.
+
+        Returns:
+            Optional[RequestsCookieJar]: The jar, or None if no usable cookies were saved.
+        """
+        cookie_path = Path(self.COOKIE_FILE)
+        try:
+            with self._cookie_lock:
+                cookies = _load_cookies(str(cookie_path), cookie_path.stat().st_mtime_ns)
+        except (OSError, ValueError, TypeError):
+            return None
+
+        jar = RequestsCookieJar()
+        for c in cookies:
+            domain = c.get("domain") or ""
+            host = domain.lstrip(".")
+            if "name" in c and "value" in c and (host == "freelance.de" or host.endswith(".freelance.de")):
+                jar.set(c["name"], c["value"], domain=domain, path=c.get("path", "/"))
+        return jar if len(jar) else None
+
+    @staticmethod
+    def _is_detail_page(soup: BeautifulSoup, html: str) -> bool:
+        """Tells a real project detail page from a login, consent or challenge page.
+
+        The generic div.panel-body also appears on those pages, so it only counts
+        when the page shows the logged-in state.
+        """
+        if soup.find("div", id="project-description") or soup.find("div", class_="project-detail-content"):
+            return True
+        page = html.lower()
+        logged_in = "logout" in page or "abmelden" in page
+        return logged_in and soup.find("div", class_="panel-body") is not None
+
+    @staticmethod
+    def _find_description(soup: BeautifulSoup) -> Optional[Tag]:
+        """Returns the project description container of a detail page, if present."""
+        container = (
+            soup.find("div", id="project-description")
+            or soup.find("div", class_="panel-body")
+            or soup.find("div", class_="project-detail-content")
+        )
+        return container if isinstance(container, Tag) else None
+
+    @classmethod
+    def _parse_detail(cls, soup: BeautifulSoup) -> Dict[str, str]:
+        """Extracts description, skills, title and metadata from a parsed detail page."""
+        # 1. Description
+        desc = ""
+        container = cls._find_description(soup)
+        if container:
+            desc = container.get_text(separator="\n", strip=True)
+
+        # FIX: Scrape Skill Tags/Badges from detail page to enrich context
+        skills = []
+        for badge in soup.find_all(class_=_SKILL_RE):
+            skills.append(badge.get_text(strip=True))
+        if skills:
+            desc += "\n\nSkills & Keywords: " + ", ".join(skills)
+
+        # 2. Title
+        title = ""
+        h1 = soup.find("h1")
+        if h1:
+            title = h1.get_text(strip=True).replace(" - freelance.de", "").split("Firmenname")[0].strip()
+
+        # 3. Metadata
+        location = "Germany/Remote"
+        company = "Freelance.de Client"
+
+        meta_ul = soup.find("ul", class_=_META_UL_DETAIL_RE)
+        if meta_ul:
+            for li in meta_ul.find_all("li", recursive=False):
+                txt = li.get_text(strip=True)
+                icons = _icon_classes(li)
+                if any(x in icons for x in _LOCATION_ICONS):
+                    location = txt
+                elif "fa-building" in icons:
+                    company = txt
+
+        return {"description": desc, "title": title, "company": company, "location": location}
+
     def _perform_ui_search(self, driver: uc.Chrome, keywords: str, location: str) -> None:
         """Executes search via UI with fallback."""
         wait = WebDriverWait(driver, 15)
@@ -272,13 +427,63 @@ class FreelanceDeProvider:
 
             submit_sel = "#ga4-hp-projekt-suchen, button[type='submit'], .btn-search"
             submit_btn = driver.find_element(By.CSS_SELECTOR, submit_sel)
+            old_root = driver.find_element(By.TAG_NAME, "html")
+            old_url = driver.current_url
             driver.execute_script("arguments[0].click();", submit_btn)
+            # The click only schedules navigation; the old page must not satisfy the results wait
+            self._wait_for_navigation(driver, old_root, old_url)
         except Exception:
             direct_url = (
                 f"{self.BASE_URL}/search/project.php?ad_search[keywords]={keywords}&ad_search[location]={location}"
             )
             driver.get(direct_url)
 
+    @classmethod
+    def _acquire_driver(cls) -> uc.Chrome:
+        """Takes an idle browser from the pool, or starts a new one if none is usable."""
+        while True:
+            try:
+                driver = cls._driver_pool.get_nowait()
+            except Empty:
+                break
+            if cls._is_alive(driver):
+                return driver
+            cls._quit_driver(driver)
+
+        with cls._pool_lock:
+            if not cls._pool_exit_hook:
+                atexit.register(cls.close_pool)
+                cls._pool_exit_hook = True
+        return SeleniumFactory.setup_driver()
+
+    @staticmethod
+    def _is_alive(driver: uc.Chrome) -> bool:
+        """Checks with a cheap round-trip that a pooled browser still responds."""
+        try:
+            return bool(driver.session_id) and isinstance(driver.current_url, str)
+        except Exception:
+            return False
+
+    @classmethod
+    def _release_driver(cls, driver: uc.Chrome) -> None:
+        """Returns a healthy browser to the pool for the next call."""
+        cls._driver_pool.put(driver)
+
+    @classmethod
+    def close_pool(cls) -> None:
+        """Quits every idle pooled browser (registered with atexit on first use)."""
+        while True:
+            try:
+                cls._quit_driver(cls._driver_pool.get_nowait())
+            except Empty:
+                return
+
+    @staticmethod
+    def _quit_driver(driver: uc.Chrome) -> None:
+        """Quits a browser, ignoring errors from an already dead session."""
+        with contextlib.suppress(Exception):
+            driver.quit()
+
     def _safe_quit(self, driver: uc.Chrome) -> None:
         """Safely terminates driver service."""
         with contextlib.suppress(Exception):
@@ -293,22 +498,23 @@ class FreelanceDeProvider:
         try:
             driver.get(self.BASE_URL)
             time.sleep(1)
-            with cookie_path.open("r", encoding="utf-8") as f:
-                cookies = json.load(f)
-                for c in cookies:
-                    driver.add_cookie(c)
+            with self._cookie_lock:
+                cookies = _load_cookies(str(cookie_path), cookie_path.stat().st_mtime_ns)
+            for c in cookies:
+                driver.add_cookie(c)
             driver.refresh()
             time.sleep(2)
-            return "logout" in driver.page_source.lower() or "abmelden" in driver.page_source.lower()
+            page = self._page_html(driver).lower()
         except Exception:
             return False
+        else:
+            return "logout" in page or "abmelden" in page
 
     def _perform_login(self, driver: uc.Chrome) -> bool:
         """Performs robust login procedure."""
         with contextlib.suppress(Exception):
-            profile = json.loads(Path("configs/my_profile/my_profile.json").read_text(encoding="utf-8"))
-            creds = profile.get("credentials", {})
-            user, pw = creds.get("freelance_de_user"), creds.get("freelance_de_pass")
+            profile_path = Path(self.PROFILE_FILE)
+            user, pw = _load_credentials(str(profile_path), profile_path.stat().st_mtime_ns)
 
             if not user or not pw:
                 return False
@@ -326,13 +532,75 @@ class FreelanceDeProvider:
             time.sleep(0.5)
             driver.execute_script("arguments[0].click();", login_btn)
 
-            time.sleep(7)
-            if any(kw in driver.page_source.lower() for kw in ["logout", "abmelden"]):
-                with Path(self.COOKIE_FILE).open("w", encoding="utf-8") as f:
-                    json.dump(driver.get_cookies(), f)
+            if self._wait_for_logged_in(driver):
+                cookies = driver.get_cookies()
+                with self._cookie_lock, Path(self.COOKIE_FILE).open("w", encoding="utf-8") as f:
+                    json.dump(cookies, f)
                 return True
         return False
 
+    def _wait_for(self, driver: uc.Chrome, selector: str) -> bool:
+        """Waits until an element matching the CSS selector is present, capped at PAGE_WAIT_SECONDS.
+
+        Args:
+            driver: The browser instance.
+            selector: CSS selector signalling that the page content has rendered.
+
+        Returns:
+            bool: True if the element appeared, False if the wait timed out.
+        """
+        try:
+            WebDriverWait(driver, self.PAGE_WAIT_SECONDS).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+        except TimeoutException:
+            return False
+        else:
+            return True
+
+    def _wait_for_navigation(self, driver: uc.Chrome, old_root: WebElement, old_url: str) -> bool:
+        """Waits until the browser has left the current page, capped at PAGE_WAIT_SECONDS.
+
+        Args:
+            driver: The browser instance.
+            old_root: The <html> element of the page before the click.
+            old_url: The URL before the click.
+
+        Returns:
+            bool: True if the old document was replaced or the URL changed, False if the wait timed out.
+        """
+        try:
+            WebDriverWait(driver, self.PAGE_WAIT_SECONDS).until(
+                EC.any_of(EC.staleness_of(old_root), EC.url_changes(old_url))
+            )
+        except TimeoutException:
+            return False
+        else:
+            return True
+
+    def _wait_for_logged_in(self, driver: uc.Chrome) -> bool:
+        """Waits until the page shows a logout link, capped at PAGE_WAIT_SECONDS."""
+        try:
+            WebDriverWait(driver, self.PAGE_WAIT_SECONDS).until(
+                lambda d: any(kw in self._page_html(d).lower() for kw in ("logout", "abmelden"))
+            )
+        except TimeoutException:
+            return False
+        else:
+            return True
+
+    @staticmethod
+    def _page_html(driver: uc.Chrome) -> str:
+        """Returns the rendered document HTML, read via Chrome DevTools with page_source as fallback.
+
+        DOM.getOuterHTML serializes the live DOM in the browser in one call, without
+        the WebDriver script round-trip behind page_source.
+        """
+        with contextlib.suppress(Exception):
+            root = driver.execute_cdp_cmd("DOM.getDocument", {"depth": 0})["root"]["nodeId"]
+            return str(driver.execute_cdp_cmd("DOM.getOuterHTML", {"nodeId": root})["outerHTML"])
+        return str(driver.page_source)
+
     def _handle_cookies(self, driver: uc.Chrome) -> None:
         """Removes cookie banners."""
         with contextlib.suppress(Exception):
@@ -346,8 +614,8 @@ class FreelanceDeProvider:
         """Dumps debug info."""
         ts = datetime.now(timezone.utc).strftime("%H%M%S")
         with contextlib.suppress(Exception):
-            Path(f"logs/debug_{ts}_{name}.html").write_text(driver.page_source, encoding="utf-8")
+            Path(f"logs/debug_{ts}_{name}.html").write_bytes(driver.page_source.encode("utf-8", errors="replace"))
             driver.save_screenshot(str(Path(f"logs/debug_{ts}_{name}.png")))
 
 
-# End of src/core/providers/freelance_de.py (v. 00055)
+# End of src/core/providers/freelance_de.py (v. 00069)
@@ -6,8 +6,8 @@
 
 This module handles searching and data extraction from Freelancermap.de using
 the centralized SeleniumFactory and advanced React-state JSON parsing.
-Refactored (v. 00023) - Clean Code: Split _extract_deep_data into sub-methods
-to resolve Ruff PLR0912 (Too many branches) and improved SRP.
+Refactored (v. 00025) - Performance: Diagnostic page dumps are encoded once with
+errors='replace' and written as bytes.
 """
 
 import contextlib
@@ -100,9 +100,10 @@ class FreelancermapProvider:
             project_items = soup.find_all("div", class_=item_class)
             print(f"   [DEBUG] [FM] Found {len(project_items)} items for {location}.")
 
+            scraped_at = datetime.now(timezone.utc).isoformat()
             for card in project_items[:limit]:
                 if isinstance(card, Tag):
-                    job_data = self._parse_card(card, keywords, location)
+                    job_data = self._parse_card(card, keywords, location, scraped_at)
                     if job_data:
                         found_jobs.append(job_data)
 
@@ -133,12 +134,12 @@ class FreelancermapProvider:
         """Dumps page source and screenshot for debugging."""
         ts = datetime.now(timezone.utc).strftime("%H%M%S")
         log_path = Path(f"logs/debug_{ts}_{name}.html")
-        log_path.write_text(driver.page_source, encoding="utf-8")
+        log_path.write_bytes(driver.page_source.encode("utf-8", errors="replace"))
         img_path = Path(f"logs/debug_{ts}_{name}.png")
         with contextlib.suppress(Exception):
             driver.save_screenshot(str(img_path))
 
-    def _parse_card(self, card: Tag, query: str, req_loc: str) -> Optional[Dict[str, Any]]:
+    def _parse_card(self, card: Tag, query: str, req_loc: str, scraped_at: str) -> Optional[Dict[str, Any]]:
         """Extracts data from a single project card."""
         try:
             link_tag = card.find("a", attrs={"data-testid": "title"})
@@ -158,7 +159,7 @@ class FreelancermapProvider:
             created_tag = card.find("span", attrs={"data-testid": "created"})
             posted_at = created_tag.get_text(strip=True) if created_tag else "Recent"
 
-            return {
+            job_data: Dict[str, Any] = {
                 "title": title,
                 "company": "Freelancermap Client",
                 "location": location,
@@ -166,7 +167,7 @@ class FreelancermapProvider:
                 "job_id": job_id,
                 "provider": "freelancermap",
                 "posted_at_relative": posted_at,
-                "scraped_at": datetime.now(timezone.utc).isoformat(),
+                "scraped_at": scraped_at,
                 "description": "",
                 "relevance_score": 0,
                 "work_location_type": "On-site",
@@ -175,6 +176,8 @@ class FreelancermapProvider:
             }
         except Exception:
             return None
+        else:
+            return job_data
 
     def fetch_full_description(self, url: str) -> Union[str, Dict[str, str]]:
         """Fetches full project description and company metadata."""
@@ -284,4 +287,4 @@ class FreelancermapProvider:
                 result["description"] = cont.get_text(separator="\n", strip=True)
 
 
-# End of src/core/providers/freelancermap.py (v. 00023)
+# End of src/core/providers/freelancermap.py (v. 00025)
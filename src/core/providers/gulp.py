@@ -6,8 +6,8 @@
 
 This module handles searching and data extraction from GULP.de (Randstad) using
 the centralized SeleniumFactory. Optimized for Angular 21+ structure.
-Refactored (v. 00017) - Compliance: Resolved Ruff SIM108 and TRY300.
-Added rich badge extraction for immediate skill matching in Phase 1.
+Refactored (v. 00018) - Performance: scraped_at is captured once per result page
+and passed to the card parser instead of calling datetime.now per job.
 """
 
 import contextlib
@@ -32,12 +32,13 @@ from src.core.selenium_factory import SeleniumFactory
 class GulpJobParser:
     """Helper class to parse a single Angular search-project-card from GULP."""
 
-    def __init__(self, card: Tag, domain: str, query: str, req_loc: str) -> None:
+    def __init__(self, card: Tag, domain: str, query: str, req_loc: str, scraped_at: str) -> None:
         """Initializes the parser."""
         self.card = card
         self.domain = domain
         self.query = query
         self.req_loc = req_loc
+        self.scraped_at = scraped_at
 
     def parse(self) -> Optional[Dict[str, Any]]:
         """Orchestrates the parsing sequence."""
@@ -58,7 +59,7 @@ class GulpJobParser:
                 "job_id": link_data["job_id"],
                 "provider": "gulp",
                 "posted_at_relative": meta["posted_at"],
-                "scraped_at": datetime.now(timezone.utc).isoformat(),
+                "scraped_at": self.scraped_at,
                 "description": description,  # Rich text for Phase 1 scoring
                 "relevance_score": 0,
                 "work_location_type": "Remote" if meta["is_remote"] else "On-site",
@@ -185,9 +186,10 @@ class GulpProvider:
 
             print(f"   [DEBUG] [GULP] Found {len(cards)} items.")
 
+            scraped_at = datetime.now(timezone.utc).isoformat()
             for card in cards[:limit]:
                 if isinstance(card, Tag):
-                    job = GulpJobParser(card, self.DOMAIN, keywords, location).parse()
+                    job = GulpJobParser(card, self.DOMAIN, keywords, location, scraped_at).parse()
                     if job:
                         found_jobs.append(job)
 
@@ -278,4 +280,4 @@ class GulpProvider:
             driver.execute_script("arguments[0].click();", btn)
 
 
-# End of src/core/providers/gulp.py (v. 00017)
+# End of src/core/providers/gulp.py (v. 00018)
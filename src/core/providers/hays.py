@@ -6,8 +6,8 @@
 
 This module handles searching and data extraction from Hays.de using
 standard requests and BeautifulSoup for HTML parsing.
-Refactored (v. 00013) - Bugfix: Fixed location overwriting issue in enrichment.
-Now extracts detailed location or preserves existing one if not found.
+Refactored (v. 00014) - Performance: scraped_at is captured once per result page
+and passed to the card parser instead of calling datetime.now per job.
 """
 
 import random
@@ -70,9 +70,10 @@ class HaysProvider:
 
             print(f"   [DEBUG] [Hays] Found {len(cards)} items.")
 
+            scraped_at = datetime.now(timezone.utc).isoformat()
             for card in cards[:limit]:
                 if isinstance(card, Tag):
-                    job_data = self._parse_card(card, keywords, location)
+                    job_data = self._parse_card(card, keywords, location, scraped_at)
                     if job_data:
                         found_jobs.append(job_data)
         except Exception as e:
@@ -81,7 +82,7 @@ class HaysProvider:
 
         return found_jobs
 
-    def _parse_card(self, card: Tag, query: str, req_loc: str) -> Optional[Dict[str, Any]]:
+    def _parse_card(self, card: Tag, query: str, req_loc: str, scraped_at: str) -> Optional[Dict[str, Any]]:
         """Extracts summary data from an HTML card."""
         try:
             t_tag = card.find("h4", class_="search__result__header__title")
@@ -126,7 +127,7 @@ class HaysProvider:
                 "job_id": job_id,
                 "provider": "hays",
                 "posted_at_relative": posted_at,
-                "scraped_at": datetime.now(timezone.utc).isoformat(),
+                "scraped_at": scraped_at,
                 "description": description,  # Populated for Phase 1 scoring
                 "relevance_score": 0,
                 "work_location_type": "Remote"
@@ -203,4 +204,4 @@ class HaysProvider:
         return result if result else ""
 
 
-# End of src/core/providers/hays.py (v. 00013)
+# End of src/core/providers/hays.py (v. 00014)
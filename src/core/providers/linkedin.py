@@ -5,8 +5,8 @@
 """LinkedIn Job Provider Module.
 
 This module handles searching and data extraction from LinkedIn's Guest API.
-Refactored (v. 00011) - Compliance: Fixed missing 'random' import (F821)
-and optimized try-except control flow (TRY300) after Ruff validation.
+Refactored (v. 00012) - Performance: scraped_at is captured once per result page
+and passed to the card parser instead of calling datetime.now per job.
 """
 
 import contextlib
@@ -77,8 +77,9 @@ class LinkedInProvider:
             soup = BeautifulSoup(response.text, "html.parser")
             job_cards = soup.find_all("li")
 
+            scraped_at = datetime.now(timezone.utc).isoformat()
             for card in job_cards[:limit]:
-                job = self._parse_card(card)
+                job = self._parse_card(card, scraped_at)
                 if job:
                     job["search_criteria"] = f"{keywords} | {location}"
                     job["provider"] = "linkedin"
@@ -92,11 +93,12 @@ class LinkedInProvider:
 
         return found_jobs
 
-    def _parse_card(self, card: Tag) -> Optional[Dict[str, Any]]:
+    def _parse_card(self, card: Tag, scraped_at: str) -> Optional[Dict[str, Any]]:
         """Parses individual LinkedIn job card HTML with enhanced type detection.
 
         Args:
             card: BS4 Tag representing a single job entry.
+            scraped_at: ISO timestamp captured once for the whole result page.
 
         Returns:
             Optional[Dict[str, Any]]: Normalized job data or None if parsing fails.
@@ -130,7 +132,7 @@ class LinkedInProvider:
                 "link": href.split("?")[0],
                 "job_id": href.split("/")[-1].split("?")[0] if "jobs/view/" in href else href,
                 "posted_at_relative": "Recent",
-                "scraped_at": datetime.now(timezone.utc).isoformat(),
+                "scraped_at": scraped_at,
                 "description": "",
                 "relevance_score": 0,
             }
@@ -229,4 +231,4 @@ class LinkedInProvider:
         return ""
 
 
-# End of src/core/providers/linkedin.py (v. 00011)
+# End of src/core/providers/linkedin.py (v. 00012)
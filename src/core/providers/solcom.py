@@ -5,8 +5,8 @@
 """SOLCOM Job Provider Module (Undetected Selenium).
 
 This module handles searching and data extraction from SOLCOM.de.
-Refactored (v. 00050) - Deep Extraction Strategy: Shifted focus to Detail Page 
-scraping. Now extracts all text relative to the H1 header to capture hidden skills.
+Refactored (v. 00052) - Performance: Diagnostic page dumps are encoded once with
+errors='replace' and written as bytes.
 """
 
 import contextlib
@@ -99,8 +99,9 @@ class SolcomProvider:
                 self._dump_diagnostics(driver, f"solcom_zero_{keywords}")
             else:
                 print(f"   [DEBUG] [SOLCOM] Found {len(items)} items. Collecting links for deep enrichment...")
+                scraped_at = datetime.now(timezone.utc).isoformat()
                 for card in items[:limit]:
-                    job = self._parse_card(card, keywords, location)
+                    job = self._parse_card(card, keywords, location, scraped_at)
                     if job:
                         found_jobs.append(job)
 
@@ -147,7 +148,7 @@ class SolcomProvider:
         with contextlib.suppress(Exception):
             driver.execute_script(script)
 
-    def _parse_card(self, card: Tag, query: str, req_loc: str) -> Optional[Dict[str, Any]]:
+    def _parse_card(self, card: Tag, query: str, req_loc: str, scraped_at: str) -> Optional[Dict[str, Any]]:
         """Parses a project card from list view."""
         try:
             h_div = card.find("div", class_="project-header")
@@ -174,7 +175,7 @@ class SolcomProvider:
                 "job_id": str(href.split("/")[-1]),
                 "provider": "solcom",
                 "posted_at_relative": "Recent",
-                "scraped_at": datetime.now(timezone.utc).isoformat(),
+                "scraped_at": scraped_at,
                 "description": "", # Will be filled in Phase 3
                 "relevance_score": 0,
                 "work_location_type": "Remote" if "remote" in title.lower() else "On-site",
@@ -241,8 +242,8 @@ class SolcomProvider:
         ts = datetime.now(timezone.utc).strftime("%H%M%S")
         with contextlib.suppress(Exception):
             log_path = Path(f"logs/debug_{ts}_{name}.html")
-            log_path.write_text(driver.page_source, encoding="utf-8")
+            log_path.write_bytes(driver.page_source.encode("utf-8", errors="replace"))
             driver.save_screenshot(str(Path(f"logs/debug_{ts}_{name}.png")))
 
 
-# End of src/core/providers/solcom.py (v. 00050)
\ No newline at end of file
+# End of src/core/providers/solcom.py (v. 00052)
\ No newline at end of file
@@ -6,8 +6,8 @@
 
 This module handles searching and data extraction from XING.com using
 the centralized SeleniumFactory.
-Refactored (v. 00028) - Data Recovery: Added aggressive fallbacks (Page Title)
-and relaxed return conditions to prevent 'Pending Extraction' in Manual Mode.
+Refactored (v. 00029) - Performance: scraped_at is captured once per result page
+and passed to the card parser instead of calling datetime.now per job.
 """
 
 import contextlib
@@ -77,9 +77,10 @@ class XingProvider:
             job_articles = soup.find_all("article")
             print(f"   [DEBUG] [XING] Found {len(job_articles)} items.")
 
+            scraped_at = datetime.now(timezone.utc).isoformat()
             for card in job_articles[:limit]:
                 if isinstance(card, Tag):
-                    job_data = self._parse_card(card, keywords, location)
+                    job_data = self._parse_card(card, keywords, location, scraped_at)
                     if job_data:
                         found_jobs.append(job_data)
 
@@ -106,7 +107,7 @@ class XingProvider:
             driver.execute_script("arguments[0].click();", cookie_btn)
             time.sleep(1)
 
-    def _parse_card(self, card: Tag, query: str, req_loc: str) -> Optional[Dict[str, Any]]:
+    def _parse_card(self, card: Tag, query: str, req_loc: str, scraped_at: str) -> Optional[Dict[str, Any]]:
         """Extracts basic job data from a card."""
         try:
             link_tag = card.find("a", href=re.compile(r"/jobs/"))
@@ -131,7 +132,7 @@ class XingProvider:
                 "job_id": str(job_id),
                 "provider": "xing",
                 "posted_at_relative": "Recent",
-                "scraped_at": datetime.now(timezone.utc).isoformat(),
+                "scraped_at": scraped_at,
                 "description": "",
                 "relevance_score": 0,
                 "work_location_type": "On-site",
@@ -227,4 +228,4 @@ class XingProvider:
                 data["description"] = desc_section.get_text(separator="\n", strip=True)
 
 
-# End of src/core/providers/xing.py (v. 00028)
+# End of src/core/providers/xing.py (v. 00029)
@@ -6,8 +6,8 @@
 
 This module handles cumulative storage, multi-portal synchronization,
 rolling directory cleanup, and automated database rotation/archiving.
-Refactored (v. 00012) - Compliance: Fixed Ruff SIM117 by merging multiple
-context managers into a single 'with' statement.
+Refactored (v. 00013) - Performance: Output JSON files are parsed with orjson
+when it is installed, falling back to the stdlib json module.
 """
 
 import contextlib
@@ -20,6 +20,13 @@ from typing import Any, Dict, List, Set
 
 import pandas as pd  # type: ignore
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # Optional speed-up, stdlib json is the fallback
+    HAS_ORJSON = False
+
 
 class PersistenceManager:
     """Manages global result storage, deduplication, and automated data lifecycle."""
@@ -116,9 +123,8 @@ class PersistenceManager:
                 json_file = folder / "all_jobs_raw.json"
 
             if json_file.exists():
-                # SIM117 Fix: Merged multiple with statements into one
-                with contextlib.suppress(Exception), json_file.open("r", encoding="utf-8") as f:
-                    jobs = json.load(f)
+                with contextlib.suppress(Exception):
+                    jobs = self._load_jobs_json(json_file)
                     if isinstance(jobs, list):
                         count = self.update_cumulative_results(jobs, headers)
                         if count > 0:
@@ -127,6 +133,21 @@ class PersistenceManager:
 
         return total_new
 
+    @staticmethod
+    def _load_jobs_json(json_file: Path) -> object:
+        """Parses an output JSON file, using orjson when it is installed.
+
+        Args:
+            json_file: Path to a jobs.json / all_jobs_raw.json export.
+
+        Returns:
+            object: The decoded JSON document (callers check the type).
+        """
+        if HAS_ORJSON:
+            return orjson.loads(json_file.read_bytes())
+        with json_file.open("r", encoding="utf-8") as f:
+            return json.load(f)
+
     def rotate_results_database(self, retention_days: int = 180) -> int:
         """Archives records older than the retention period to cold storage.
 
@@ -242,4 +263,4 @@ class PersistenceManager:
         return str(excel_path)
 
 
-# End of src/utils/persistence_manager.py (v. 00012)
+# End of src/utils/persistence_manager.py (v. 00013)